@@ -14,8 +14,8 @@ from telegram.ext import (
 import config
 from utils.logger import get_logger
 from bot.conversation import ConversationManager
-from recommendation.engine import RecommendationEngine
-from integration.notifier import BusinessNotifier
+from recommendation.engine import get_engine
+from integration.notifier import get_notifier
 
 logger = get_logger("bot")
 
@@ -36,8 +36,8 @@ class TashiBot:
         
         # Initialize components
         self.conversation_manager = ConversationManager()
-        self.recommendation_engine = RecommendationEngine()
-        self.business_notifier = BusinessNotifier()
+        self.recommendation_engine = get_engine()
+        self.business_notifier = get_notifier()
         
         # Set up handlers
         self._setup_handlers()
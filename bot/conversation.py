@@ -5,6 +5,7 @@ from enum import Enum, auto
 from typing import Dict, Any, Optional, List, Union
 import json
 import os
+import re
 from openai import OpenAI
 from dotenv import load_dotenv
 
@@ -16,6 +17,19 @@ load_dotenv()
 
 logger = get_logger("conversation")
 
+# Month-name helpers shared by the date-handling methods. The regex matches
+# full or abbreviated month names ("October", "Oct") in lowercased text.
+_MONTHS = [
+    'January', 'February', 'March', 'April', 'May', 'June',
+    'July', 'August', 'September', 'October', 'November', 'December'
+]
+_MONTH_RE = re.compile(r'\b(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*')
+_MONTH_IDX = {month[:3].lower(): i + 1 for i, month in enumerate(_MONTHS)}
+
+# Common words excluded when mining free text for interests; frozenset
+# gives O(1) membership per word
+_STOP_WORDS = frozenset({'this', 'that', 'with', 'from', 'have', 'would', 'about', 'like'})
+
 # Initialize OpenAI client with the API key from environment variables
 openai_api_key = os.getenv("OPENAI_API_KEY")
 client = None
@@ -162,7 +176,10 @@ class ConversationManager:
         # Get the current conversation state and data
         conversation = self.conversations[user_id]
         current_state = conversation['state']
-        
+
+        # Lowercase once per turn; the classifier helpers expect lowercased text
+        message_lower = message_text.lower()
+
         # Process message based on current state
         if current_state == ConversationState.GREETING:
             # Transition to asking for trip type
@@ -208,9 +225,8 @@ class ConversationManager:
             conversation['state'] = ConversationState.RECOMMENDATIONS
             
             # Get recommendations from the recommendation engine based on preferences
-            from recommendation.engine import RecommendationEngine
-            recommendation_engine = RecommendationEngine()
-            recommendations = recommendation_engine.recommend_by_preferences(conversation['preferences'])
+            from recommendation.engine import get_engine
+            recommendations = get_engine().recommend_by_preferences(conversation['preferences'])
             
             # Update festival dates with current year if needed
             if conversation['preferences'].get('trip_type') == 'festival':
@@ -238,13 +254,13 @@ class ConversationManager:
         
         elif current_state == ConversationState.RECOMMENDATION_DETAILS:
             # Process response to recommendation details
-            if self._is_affirmative(message_text):
+            if self._is_affirmative(message_lower):
                 # User confirmed this recommendation
                 conversation['state'] = ConversationState.FINALIZATION
                 
                 # In the actual implementation, this would send the details to the Breathe Bhutan team
                 response = "Great! I'll finalize your travel plan. Could you please provide your name and email so the Breathe Bhutan team can contact you?"
-            elif self._is_negative(message_text):
+            elif self._is_negative(message_lower):
                 # User rejected this recommendation, go back to recommendations
                 conversation['state'] = ConversationState.RECOMMENDATIONS
                 response = "No problem! Let's look at other options.\n\n" + self._format_recommendations_with_buttons(conversation['recommendations'])
@@ -265,7 +281,7 @@ class ConversationManager:
         
         elif current_state == ConversationState.COMPLETED:
             # Conversation is completed, start a new one if user wants to
-            if self._is_restart(message_text):
+            if self._is_restart(message_lower):
                 return self.start_conversation(user_id)
             else:
                 response = "Your travel plan has been sent to the Breathe Bhutan team. If you'd like to plan another trip, just say 'start over'."
@@ -290,7 +306,10 @@ class ConversationManager:
             current_state (ConversationState): Current conversation state
         """
         conversation = self.conversations[user_id]
-        
+
+        # Lowercase once per turn; the classifier helpers expect lowercased text
+        message_lower = message_text.lower()
+
         # State transitions
         if current_state == ConversationState.GREETING:
             # Always move to trip type after greeting
@@ -322,9 +341,8 @@ class ConversationManager:
             conversation['state'] = ConversationState.RECOMMENDATIONS
             
             # Get recommendations from the recommendation engine
-            from recommendation.engine import RecommendationEngine
-            recommendation_engine = RecommendationEngine()
-            recommendations = recommendation_engine.recommend_by_preferences(conversation['preferences'])
+            from recommendation.engine import get_engine
+            recommendations = get_engine().recommend_by_preferences(conversation['preferences'])
             
             # Update festival dates with current year if needed
             if conversation['preferences'].get('trip_type') == 'festival':
@@ -341,9 +359,9 @@ class ConversationManager:
         
         elif current_state == ConversationState.RECOMMENDATION_DETAILS:
             # Check for yes/no response
-            if self._is_affirmative(message_text):
+            if self._is_affirmative(message_lower):
                 conversation['state'] = ConversationState.FINALIZATION
-            elif self._is_negative(message_text):
+            elif self._is_negative(message_lower):
                 conversation['state'] = ConversationState.RECOMMENDATIONS
         
         elif current_state == ConversationState.FINALIZATION:
@@ -354,7 +372,7 @@ class ConversationManager:
         
         elif current_state == ConversationState.COMPLETED:
             # Check for restart request
-            if self._is_restart(message_text):
+            if self._is_restart(message_lower):
                 # Reset conversation (will be handled in process_message)
                 pass
     
@@ -629,7 +647,7 @@ class ConversationManager:
             words = message_lower.split()
             for word in words:
                 # Exclude very short words and common stop words
-                if len(word) > 3 and word not in ['this', 'that', 'with', 'from', 'have', 'would', 'about', 'like']:
+                if len(word) > 3 and word not in _STOP_WORDS:
                     interests.append(word)
         
         return interests if interests else ['culture', 'nature']  # Default interests if none found
@@ -692,9 +710,9 @@ class ConversationManager:
             str: Formatted recommendation details
         """
         # Handle different data structures (trekking vs other recommendations)
-        title = recommendation.get('title', recommendation.get('name', 'Unknown'))
-        duration = recommendation.get('duration', recommendation.get('duration_days', 'Unknown'))
-        description = recommendation.get('description', recommendation.get('summary', ''))
+        title = recommendation.get('title') or recommendation.get('name') or 'Unknown'
+        duration = recommendation.get('duration') or recommendation.get('duration_days') or 'Unknown'
+        description = recommendation.get('description') or recommendation.get('summary') or ''
         
         message = f"*{title}*\n\n"
         message += f"*Duration:* {duration} days\n\n"
@@ -782,44 +800,44 @@ class ConversationManager:
             "email": email
         }
     
-    def _is_affirmative(self, message_text: str) -> bool:
+    def _is_affirmative(self, message_lower: str) -> bool:
         """
         Check if a message is an affirmative response.
         
         Args:
-            message_text (str): Message text from the user
+            message_lower (str): Lowercased message text from the user
             
         Returns:
             bool: True if affirmative, False otherwise
         """
         affirmative_words = ['yes', 'yeah', 'yep', 'sure', 'ok', 'okay', 'confirm', 'good', 'great', 'perfect']
-        return any(word in message_text.lower() for word in affirmative_words)
+        return any(word in message_lower for word in affirmative_words)
     
-    def _is_negative(self, message_text: str) -> bool:
+    def _is_negative(self, message_lower: str) -> bool:
         """
         Check if a message is a negative response.
         
         Args:
-            message_text (str): Message text from the user
+            message_lower (str): Lowercased message text from the user
             
         Returns:
             bool: True if negative, False otherwise
         """
         negative_words = ['no', 'nope', 'not', "don't", 'dont', 'other', 'different', 'another', 'else']
-        return any(word in message_text.lower() for word in negative_words)
+        return any(word in message_lower for word in negative_words)
     
-    def _is_restart(self, message_text: str) -> bool:
+    def _is_restart(self, message_lower: str) -> bool:
         """
         Check if a message is a request to restart the conversation.
         
         Args:
-            message_text (str): Message text from the user
+            message_lower (str): Lowercased message text from the user
             
         Returns:
             bool: True if restart request, False otherwise
         """
         restart_words = ['start over', 'restart', 'reset', 'new', 'again', 'begin', 'another trip']
-        return any(phrase in message_text.lower() for phrase in restart_words)
+        return any(phrase in message_lower for phrase in restart_words)
     
     def end_conversation(self, user_id: int) -> None:
         """
@@ -945,9 +963,9 @@ class ConversationManager:
         
         # Display only a summary of the recommendations in the text message
         for i, rec in enumerate(recommendations[:5], 1):
-            title = rec.get('title', rec.get('name', 'Unknown Trek'))
-            duration = rec.get('duration', rec.get('duration_days', 'Unknown duration'))
-            summary = rec.get('summary', rec.get('description', ''))
+            title = rec.get('title') or rec.get('name') or 'Unknown Trek'
+            duration = rec.get('duration') or rec.get('duration_days') or 'Unknown duration'
+            summary = rec.get('summary') or rec.get('description') or ''
             # Truncate the summary if it's too long
             if len(summary) > 100:
                 summary = summary[:97] + "..."
@@ -964,7 +982,7 @@ class ConversationManager:
         # Create buttons in rows of 2 for better layout
         buttons = []
         for i, rec in enumerate(recommendations, 1):
-            title = rec.get('title', rec.get('name', 'Unknown Trek'))
+            title = rec.get('title') or rec.get('name') or 'Unknown Trek'
             button_text = f"{i}. {title}"
             
             # Truncate button text if too long
@@ -1007,9 +1025,9 @@ class ConversationManager:
             str: Formatted message with keyboard
         """
         # Handle different data structures (trekking vs other recommendations)
-        title = recommendation.get('title', recommendation.get('name', 'Unknown'))
-        duration = recommendation.get('duration', recommendation.get('duration_days', 'Unknown'))
-        description = recommendation.get('description', recommendation.get('summary', ''))
+        title = recommendation.get('title') or recommendation.get('name') or 'Unknown'
+        duration = recommendation.get('duration') or recommendation.get('duration_days') or 'Unknown'
+        description = recommendation.get('description') or recommendation.get('summary') or ''
         
         message = f"*{title}*\n\n"
         message += f"*Duration:* {duration} days\n\n"
@@ -1169,90 +1187,79 @@ class ConversationManager:
         current_year = current_date.year
         current_month = current_date.month
         
+        # Resolve the user's preferred month once; it does not change per
+        # recommendation
+        user_month = _MONTH_IDX.get(travel_month.lower()[:3]) if travel_month else None
+        user_wants_next_year = user_month is not None and user_month < current_month
+        
         # Clone the recommendations to avoid modifying the original data
         updated_recommendations = []
         
         for rec in recommendations:
-            # Clone the recommendation
-            updated_rec = rec.copy()
-            
             # Get festival month (from dates field)
-            festival_dates = updated_rec.get('dates', '')
+            festival_dates = rec.get('dates', '')
+
+            # Extract month from dates field; the regex matches full and
+            # abbreviated month names in a single pass
             festival_month = None
-            
-            # Extract month from dates field
-            months = [
-                'January', 'February', 'March', 'April', 'May', 'June',
-                'July', 'August', 'September', 'October', 'November', 'December'
-            ]
-            
-            for i, month in enumerate(months):
-                if month in festival_dates or month.lower() in festival_dates:
-                    festival_month = i + 1  # 1-indexed month
-                    break
-                
-            if not festival_month:
-                # Try with shortened month names
-                for i, month in enumerate(months):
-                    if month[:3] in festival_dates:
-                        festival_month = i + 1
-                        break
-            
-            # Determine appropriate year
-            festival_year = current_year
-            
-            # If festival month is earlier than current month, use next year
-            if festival_month and festival_month < current_month:
+            month_match = _MONTH_RE.search(festival_dates.lower())
+            if month_match:
+                festival_month = _MONTH_IDX[month_match.group(1)]  # 1-indexed month
+
+            # Determine appropriate year: the user's preferred month wins when
+            # known, otherwise roll festivals whose month has passed to next year
+            if user_month is not None:
+                festival_year = current_year + 1 if user_wants_next_year else current_year
+            elif festival_month and festival_month < current_month:
                 festival_year = current_year + 1
-                
-            # If user's preferred travel month is specified, align with that
-            if travel_month:
-                user_month = None
-                for i, month in enumerate(months):
-                    if month.lower() == travel_month.lower():
-                        user_month = i + 1
-                        break
-                
-                if user_month:
-                    # If user's month is this year or next year
-                    if user_month < current_month:
-                        # User wants to travel next year
-                        festival_year = current_year + 1
-                    else:
-                        # User wants to travel this year
-                        festival_year = current_year
-            
-            # Update the name and description with the year
-            if 'name' in updated_rec:
-                # Extract dates from festival dates field
-                import re
-                date_pattern = r'\((.*?)\d+.*?\)'
-                date_match = re.search(date_pattern, festival_dates)
-                
-                if date_match:
-                    date_info = date_match.group(1).strip()
-                    
-                    # Check if there are specific dates
-                    day_pattern = r'(\d+)(st|nd|rd|th)'
-                    day_matches = re.findall(day_pattern, festival_dates)
-                    
-                    if day_matches:
-                        day_numbers = [m[0] for m in day_matches]
-                        if len(day_numbers) >= 2:
-                            # Format: Name (Month Day-Day, Year)
-                            days_range = f"{day_numbers[0]}-{day_numbers[-1]}"
-                            updated_rec['name'] = f"{updated_rec['name']} ({months[festival_month-1]} {days_range}, {festival_year})"
-                        else:
-                            # Format: Name (Month Day, Year)
-                            updated_rec['name'] = f"{updated_rec['name']} ({months[festival_month-1]} {day_numbers[0]}, {festival_year})"
-                    else:
-                        # Format: Name (Month Year)
-                        updated_rec['name'] = f"{updated_rec['name']} ({months[festival_month-1]} {festival_year})"
-                else:
-                    if festival_month:
-                        # Just append the year if we at least know the month
-                        updated_rec['name'] = f"{updated_rec['name']} ({months[festival_month-1]} {festival_year})"
-            
+            else:
+                festival_year = current_year
+
+            # Only clone the recommendation when its name actually changes
+            # (copy-on-write); most festivals pass through untouched
+            new_name = self._maybe_reformat_name(rec, festival_dates, festival_month, festival_year)
+            if new_name is None:
+                updated_recommendations.append(rec)
+                continue
+
+            updated_rec = dict(rec)
+            updated_rec['name'] = new_name
             updated_recommendations.append(updated_rec)
-        
-        return updated_recommendations 
\ No newline at end of file
+
+        return updated_recommendations
+
+    def _maybe_reformat_name(self, rec: Dict[str, Any], festival_dates: str,
+                             festival_month: Optional[int], festival_year: int) -> Optional[str]:
+        """
+        Build the festival name annotated with month, days and year.
+
+        Args:
+            rec (dict): Festival recommendation
+            festival_dates (str): Raw dates field from the recommendation
+            festival_month (int or None): Detected 1-indexed festival month
+            festival_year (int): Year to display for the festival
+
+        Returns:
+            str or None: Updated name, or None when no update is needed
+        """
+        name = rec.get('name')
+        if not name or not festival_month:
+            return None
+
+        month_name = _MONTHS[festival_month - 1]
+
+        # Extract dates from festival dates field
+        date_match = re.search(r'\((.*?)\d+.*?\)', festival_dates)
+        if date_match:
+            # Check if there are specific dates
+            day_matches = re.findall(r'(\d+)(st|nd|rd|th)', festival_dates)
+            if day_matches:
+                day_numbers = [m[0] for m in day_matches]
+                if len(day_numbers) >= 2:
+                    # Format: Name (Month Day-Day, Year)
+                    return f"{name} ({month_name} {day_numbers[0]}-{day_numbers[-1]}, {festival_year})"
+                # Format: Name (Month Day, Year)
+                return f"{name} ({month_name} {day_numbers[0]}, {festival_year})"
+
+        # Format: Name (Month Year)
+        return f"{name} ({month_name} {festival_year})" 
\ No newline at end of file
@@ -29,11 +29,26 @@ FESTIVALS_FILE = os.path.join(DATA_DIR, "festivals.json")
 TREKKING_FILE = os.path.join(DATA_DIR, "trekking.json")
 ITINERARIES_FILE = os.path.join(DATA_DIR, "itineraries.json")
 
+# On-disk record/replay cache for scraper HTTP responses; re-runs during
+# development replay from here instead of re-fetching the site
+HTTP_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".http_cache")
+
+# Optional CDP endpoint of a long-lived Chromium (e.g. ws://127.0.0.1:9222).
+# When set, the scraper attaches to it instead of launching its own browser,
+# reusing the warm disk cache and TLS sessions across runs
+CDP_URL = os.getenv("CDP_URL")
+
 # Email Configuration for Business Integration
 EMAIL_SENDER = os.getenv("EMAIL_SENDER")
 EMAIL_PASSWORD = os.getenv("EMAIL_PASSWORD")
 BREATHE_BHUTAN_EMAIL = os.getenv("BREATHE_BHUTAN_EMAIL", "contact@breathebhutan.com")
 
+# SMTP endpoint; point at a local relay (e.g. a Postfix null client) in
+# production to keep WAN latency off the request path
+SMTP_HOST = os.getenv("SMTP_HOST", "smtp.gmail.com")
+SMTP_PORT = int(os.getenv("SMTP_PORT", "587"))
+SMTP_USE_TLS = os.getenv("SMTP_USE_TLS", "true").lower() in ("1", "true", "yes")
+
 # Logging Configuration
 LOG_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "logs")
 os.makedirs(LOG_DIR, exist_ok=True)
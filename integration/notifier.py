@@ -1,24 +1,177 @@
 """
 Notifier for sending finalized travel plans to the Breathe Bhutan team.
 """
+import asyncio
+import atexit
+import concurrent.futures
 import smtplib
 import json
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
+import queue
+import threading
+import time
+from datetime import datetime
+from email import policy
+from email.message import EmailMessage
 from typing import Dict, Any, Optional, List, Union
+import aiohttp
+import aiosmtplib
 import requests
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+
 import config
 from utils.logger import get_logger
 
 logger = get_logger("business_notifier")
 
+_TS_FMT = "%Y-%m-%d %H:%M:%S"
+
+def _trim_plan(plan: Dict[str, Any], max_chars: int = 8000) -> Dict[str, Any]:
+    """
+    Cap the long free-text fields of a plan before sending it over the wire.
+    
+    Args:
+        plan (dict): Selected travel plan
+        max_chars (int): Maximum length for each text field
+        
+    Returns:
+        dict: Plan with oversized fields truncated (copied only if needed)
+    """
+    trimmed = None
+
+    # Drop the recommendation engine's lazy per-item caches (_title_lc,
+    # _season_mask, ...); they are internal duplicates — including a full
+    # copy of the description — and must not ship in the payload
+    if any(key.startswith('_') for key in plan):
+        trimmed = {key: value for key, value in plan.items() if not key.startswith('_')}
+        plan = trimmed
+
+    for field in ('description', 'summary'):
+        value = plan.get(field)
+        if isinstance(value, str) and len(value) > max_chars:
+            if trimmed is None:
+                trimmed = dict(plan)
+            trimmed[field] = value[:max_chars] + '...'
+    
+    itinerary = plan.get('itinerary')
+    if itinerary and any(
+        isinstance(day.get('description'), str) and len(day['description']) > max_chars
+        for day in itinerary
+    ):
+        if trimmed is None:
+            trimmed = dict(plan)
+        trimmed['itinerary'] = [
+            {**day, 'description': day['description'][:max_chars] + '...'}
+            if isinstance(day.get('description'), str) and len(day['description']) > max_chars
+            else day
+            for day in itinerary
+        ]
+    
+    return trimmed if trimmed is not None else plan
+
+def _dumps(payload: Dict[str, Any]) -> bytes:
+    """
+    Serialize an API payload to JSON bytes, preferring orjson when available.
+    
+    Args:
+        payload (dict): Payload to serialize
+        
+    Returns:
+        bytes: UTF-8 encoded JSON
+    """
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_UTC_Z)
+    return json.dumps(payload).encode('utf-8')
+
+# Static email body sections, built once at import
+_EMAIL_HEADER = "NEW TRAVEL PLAN REQUEST\n=======================\n"
+_EMAIL_FOOTER = "Please contact the user to confirm the travel plan and provide additional details.\n"
+
+class PipelinedSMTP(smtplib.SMTP):
+    """
+    SMTP client that pipelines MAIL FROM/RCPT TO/DATA into a single write
+    when the server advertises RFC 2920 PIPELINING, saving one network
+    round trip per command. Falls back to the stock implementation when
+    the extension is not offered.
+    """
+    
+    def sendmail(self, from_addr, to_addrs, msg, mail_options=(), rcpt_options=()):
+        self.ehlo_or_helo_if_needed()
+        
+        if not self.has_extn('pipelining') or mail_options or rcpt_options:
+            return super().sendmail(from_addr, to_addrs, msg, mail_options, rcpt_options)
+        
+        if isinstance(msg, str):
+            msg = smtplib._fix_eols(msg).encode('ascii')
+        if isinstance(to_addrs, str):
+            to_addrs = [to_addrs]
+        
+        # Write MAIL FROM, every RCPT TO and DATA in one send, then consume
+        # the responses in order
+        commands = [f'mail FROM:{smtplib.quoteaddr(from_addr)}']
+        commands.extend(f'rcpt TO:{smtplib.quoteaddr(addr)}' for addr in to_addrs)
+        commands.append('data')
+        self.sock.sendall(''.join(command + '\r\n' for command in commands).encode('ascii'))
+        
+        (code, resp) = self.getreply()
+        if code != 250:
+            # Drain the pipelined RCPT/DATA replies so the session stays usable
+            for _ in range(len(to_addrs) + 1):
+                self.getreply()
+            raise smtplib.SMTPSenderRefused(code, resp, from_addr)
+        
+        refused = {}
+        for addr in to_addrs:
+            (code, resp) = self.getreply()
+            if code not in (250, 251):
+                refused[addr] = (code, resp)
+        if len(refused) == len(to_addrs):
+            self.getreply()  # drain the DATA reply
+            raise smtplib.SMTPRecipientsRefused(refused)
+        
+        (code, resp) = self.getreply()
+        if code != 354:
+            raise smtplib.SMTPDataError(code, resp)
+        
+        # Message body is terminated by <CRLF>.<CRLF> as in smtplib.data
+        quoted = smtplib._quote_periods(msg)
+        if quoted[-2:] != smtplib.bCRLF:
+            quoted += smtplib.bCRLF
+        self.send(quoted + b'.' + smtplib.bCRLF)
+        
+        (code, resp) = self.getreply()
+        if code != 250:
+            raise smtplib.SMTPDataError(code, resp)
+        
+        return refused
+
 class BusinessNotifier:
     """
     Notifier for sending finalized travel plans to the Breathe Bhutan team.
     """
     
-    def __init__(self, email: str = None, password: str = None, recipient: str = None):
+    # Credential defaults read from config once at import instead of per
+    # instantiation
+    _DEFAULT_EMAIL = config.EMAIL_SENDER
+    _DEFAULT_PASSWORD = config.EMAIL_PASSWORD
+    _DEFAULT_RECIPIENT = config.BREATHE_BHUTAN_EMAIL
+    
+    # Shared executor so the independent email and API channels can run in
+    # parallel instead of back to back
+    _executor = concurrent.futures.ThreadPoolExecutor(max_workers=2)
+    
+    __slots__ = ('email', 'password', 'recipient', 'host', 'port', 'use_tls',
+                 '_email_disabled', '_smtp', '_smtp_lock', '_http',
+                 '_aio_session', '_async_smtp', '_async_smtp_lock',
+                 '_queue', '_drain_thread')
+    
+    def __init__(self, email: str = None, password: str = None, recipient: str = None,
+                 host: str = None, port: int = None, use_tls: bool = None):
         """
         Initialize the business notifier.
         
@@ -26,13 +179,229 @@ class BusinessNotifier:
             email (str): Email address to send from
             password (str): Email password
             recipient (str): Recipient email address
+            host (str): SMTP server hostname
+            port (int): SMTP server port (465 implies implicit TLS)
+            use_tls (bool): Whether to upgrade the connection with STARTTLS
         """
-        self.email = email or config.EMAIL_SENDER
-        self.password = password or config.EMAIL_PASSWORD
-        self.recipient = recipient or config.BREATHE_BHUTAN_EMAIL
+        self.email = email or self._DEFAULT_EMAIL
+        self.password = password or self._DEFAULT_PASSWORD
+        self.recipient = recipient or self._DEFAULT_RECIPIENT
+        self.host = host or config.SMTP_HOST
+        self.port = port or config.SMTP_PORT
+        self.use_tls = config.SMTP_USE_TLS if use_tls is None else use_tls
+        
+        # Surface missing credentials once at startup instead of on every
+        # send attempt
+        self._email_disabled = not (self.email and self.password and self.recipient)
+        if self._email_disabled:
+            logger.warning("Email credentials not configured; email notifications are disabled")
+        
+        # Cached SMTP connection, reused across notifications to avoid paying
+        # the TLS handshake and login on every send
+        self._smtp = None
+        self._smtp_lock = threading.Lock()
+        
+        # Persistent HTTP session with a keep-alive pool so webhook calls
+        # reuse connections instead of a fresh TCP+TLS setup per request.
+        # Retries happen in the transport layer: backoff with jitter on
+        # transient statuses, honoring any Retry-After header
+        retries = Retry(
+            total=3,
+            backoff_factor=2,
+            backoff_jitter=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=frozenset(['POST']),
+            respect_retry_after_header=True
+        )
+        self._http = requests.Session()
+        self._http.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retries))
+        self._http.headers.update({'Connection': 'keep-alive', 'Content-Type': 'application/json',
+                                   'Accept-Encoding': 'gzip'})
+        
+        # Lazily-created aiohttp session for async callers; created on first
+        # use so it binds to the running event loop
+        self._aio_session = None
+        
+        # Cached aiosmtplib connection for the async email path; SMTP is a
+        # sequential protocol so sends are serialized by an asyncio lock
+        self._async_smtp = None
+        self._async_smtp_lock = asyncio.Lock()
+        
+        # Bounded in-process queue drained by a background worker, so bot
+        # handlers can fire-and-forget notifications; the bound keeps a
+        # stalled SMTP server from growing memory without limit
+        self._queue = queue.Queue(maxsize=1000)
+        self._drain_thread = threading.Thread(target=self._drain_loop, daemon=True, name='notifier-drain')
+        self._drain_thread.start()
+        
+        atexit.register(self.close)
         
         logger.info("BusinessNotifier initialized")
     
+    def _get_smtp(self) -> smtplib.SMTP:
+        """
+        Get the cached SMTP connection, reconnecting if it has gone stale.
+        
+        Returns:
+            smtplib.SMTP: Connected and authenticated SMTP session
+        """
+        if self._smtp is not None:
+            try:
+                # Cheap liveness probe; Gmail drops idle sessions
+                self._smtp.noop()
+                return self._smtp
+            except smtplib.SMTPException:
+                logger.info("Cached SMTP connection is stale, reconnecting")
+                self._close_smtp()
+        
+        # Port 465 means implicit TLS; otherwise connect plain and upgrade
+        # with STARTTLS when configured
+        if self.port == 465:
+            server = smtplib.SMTP_SSL(self.host, self.port, timeout=30)
+        else:
+            server = PipelinedSMTP(self.host, self.port, timeout=30)
+            if self.use_tls:
+                server.starttls()
+        server.login(self.email, self.password)
+        self._smtp = server
+        
+        return server
+    
+    def _close_smtp(self) -> None:
+        """
+        Close the cached SMTP connection, ignoring errors on teardown.
+        """
+        if self._smtp is not None:
+            try:
+                self._smtp.quit()
+            except Exception:
+                pass
+            self._smtp = None
+    
+    def _get_aio_session(self) -> aiohttp.ClientSession:
+        """
+        Get the shared aiohttp session, creating it on first use.
+        
+        Returns:
+            aiohttp.ClientSession: Session with a keep-alive connection pool
+        """
+        if self._aio_session is None or self._aio_session.closed:
+            self._aio_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=20, ttl_dns_cache=300, keepalive_timeout=60)
+            )
+        return self._aio_session
+    
+    def notify_business_queued(self, user_info: Dict[str, str], 
+                               preferences: Dict[str, Any], 
+                               selected_plan: Dict[str, Any]) -> bool:
+        """
+        Queue a notification for background delivery and return immediately.
+        
+        The caller returns in microseconds; the drain worker delivers the
+        plan in micro-batches over the pooled SMTP session.
+        
+        Args:
+            user_info (dict): User information (name, email)
+            preferences (dict): User preferences
+            selected_plan (dict): Selected travel plan
+            
+        Returns:
+            bool: True if queued, False if the queue is full
+        """
+        try:
+            self._queue.put_nowait((user_info, preferences, selected_plan))
+            return True
+        except queue.Full:
+            logger.error("Notification queue is full, dropping notification for user {}", user_info.get('name'))
+            return False
+    
+    def _drain_loop(self) -> None:
+        """
+        Drain queued notifications in micro-batches over one SMTP session.
+        """
+        while True:
+            # Block for the first item, then pull whatever else is already
+            # waiting, up to a micro-batch
+            items = [self._queue.get()]
+            while len(items) < 20:
+                try:
+                    items.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            
+            try:
+                self.notify_business_batch(items)
+            except Exception as e:
+                logger.error("Error draining notification queue: {}", str(e))
+            finally:
+                for _ in items:
+                    self._queue.task_done()
+    
+    def close(self, drain_timeout: float = 15.0) -> None:
+        """
+        Release any pooled connections held by the notifier.
+
+        Args:
+            drain_timeout (float): Maximum seconds to wait for queued
+                notifications to be delivered before tearing down
+        """
+        # Let the drain worker deliver anything still queued before
+        # tearing down the connections it relies on — but bound the
+        # wait: with an unreachable SMTP host every item eats a full
+        # connect timeout, and shutdown must not hang for minutes
+        deadline = time.monotonic() + drain_timeout
+        with self._queue.all_tasks_done:
+            while self._queue.unfinished_tasks:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    logger.warning(
+                        "Notification drain timed out on shutdown; dropping {} undelivered notification(s)",
+                        self._queue.unfinished_tasks)
+                    break
+                self._queue.all_tasks_done.wait(remaining)
+        
+        with self._smtp_lock:
+            self._close_smtp()
+        self._http.close()
+        
+        if self._aio_session is not None and not self._aio_session.closed:
+            try:
+                asyncio.run(self._aio_session.close())
+            except RuntimeError:
+                # close() was called from inside a running event loop; the
+                # session is torn down with the loop instead
+                pass
+        
+        if self._async_smtp is not None:
+            try:
+                asyncio.run(self._close_async_smtp())
+            except RuntimeError:
+                pass
+    
+    def _build_message(self, user_info: Dict[str, str],
+                       preferences: Dict[str, Any],
+                       selected_plan: Dict[str, Any],
+                       timestamp: str = None) -> EmailMessage:
+        """
+        Build the notification email for a finalized travel plan.
+
+        Args:
+            user_info (dict): User information (name, email)
+            preferences (dict): User preferences
+            selected_plan (dict): Selected travel plan
+            timestamp (str): Pre-formatted timestamp to reuse (optional)
+
+        Returns:
+            EmailMessage: Message ready to serialize for SMTP
+        """
+        msg = EmailMessage(policy=policy.SMTP)
+        msg['From'] = self.email
+        msg['To'] = self.recipient
+        msg['Subject'] = f"New Travel Plan Request from {user_info.get('name')}"
+        msg.set_content(self._format_email_body(user_info, preferences, selected_plan, timestamp))
+
+        return msg
+    
     def send_plan_via_email(self, user_info: Dict[str, str], 
                          preferences: Dict[str, Any], 
                          selected_plan: Dict[str, Any]) -> bool:
@@ -47,34 +416,33 @@ class BusinessNotifier:
         Returns:
             bool: True if successful, False otherwise
         """
-        logger.info(f"Sending travel plan via email for user {user_info.get('name')}")
+        logger.info("Sending travel plan via email for user {}", user_info.get('name'))
         
-        if not self.email or not self.password:
-            logger.error("Email credentials not configured")
+        if self._email_disabled:
+            logger.error("Email notifications are disabled (missing credentials)")
             return False
         
         try:
-            # Create email message
-            msg = MIMEMultipart()
-            msg['From'] = self.email
-            msg['To'] = self.recipient
-            msg['Subject'] = f"New Travel Plan Request from {user_info.get('name')}"
+            # Create the email message and serialize it to wire-ready bytes
+            # once, up front
+            msg = self._build_message(user_info, preferences, selected_plan)
+            raw = msg.as_bytes()
             
-            # Email body
-            body = self._format_email_body(user_info, preferences, selected_plan)
-            msg.attach(MIMEText(body, 'plain'))
-            
-            # Connect to SMTP server and send email
-            with smtplib.SMTP('smtp.gmail.com', 587) as server:
-                server.starttls()
-                server.login(self.email, self.password)
-                server.send_message(msg)
+            # Send over the pooled SMTP connection, retrying once on a
+            # dropped session
+            with self._smtp_lock:
+                try:
+                    self._get_smtp().sendmail(self.email, [self.recipient], raw)
+                except (smtplib.SMTPServerDisconnected, smtplib.SMTPException):
+                    logger.warning("SMTP send failed on pooled connection, reconnecting and retrying")
+                    self._close_smtp()
+                    self._get_smtp().sendmail(self.email, [self.recipient], raw)
             
-            logger.info(f"Email sent successfully to {self.recipient}")
+            logger.info("Email sent successfully to {}", self.recipient)
             return True
         
         except Exception as e:
-            logger.error(f"Error sending email: {str(e)}")
+            logger.error("Error sending email: {}", str(e))
             return False
     
     def send_plan_via_api(self, user_info: Dict[str, str], 
@@ -93,51 +461,251 @@ class BusinessNotifier:
         Returns:
             bool: True if successful, False otherwise
         """
-        logger.info(f"Sending travel plan via API for user {user_info.get('name')}")
+        logger.info("Sending travel plan via API for user {}", user_info.get('name'))
         
         if not api_url:
             logger.error("API URL not specified")
             return False
         
         try:
-            # Create payload
+            # Create payload, trimming oversized plan fields so the request
+            # body stays predictable
             payload = {
                 'user_info': user_info,
                 'preferences': preferences,
-                'selected_plan': selected_plan,
+                'selected_plan': _trim_plan(selected_plan),
                 'timestamp': self._get_current_timestamp()
             }
             
-            # Send request with retry logic
-            max_retries = 3
-            retry_delay = 2
+            # Send the request; retries/backoff are handled by the Retry
+            # policy mounted on the session adapter. The payload is
+            # serialized up front so requests does not fall back to the
+            # slower stdlib json path
+            response = self._http.post(api_url, data=_dumps(payload), timeout=(5, 30))
+            response.raise_for_status()
             
-            for attempt in range(max_retries):
+            logger.info("Plan sent successfully via API: {}", response.status_code)
+            return True
+        
+        except requests.exceptions.RequestException as e:
+            logger.error("Error sending plan via API: {}", str(e))
+            return False
+
+        except (TypeError, ValueError) as e:
+            # orjson/json raise these for non-serializable payload values;
+            # report failure instead of letting it escape notify_business
+            logger.error("Error serializing plan payload: {}", str(e))
+            return False
+    
+    async def _get_async_smtp(self) -> aiosmtplib.SMTP:
+        """
+        Get the cached aiosmtplib connection, reconnecting if needed.
+        
+        Returns:
+            aiosmtplib.SMTP: Connected and authenticated async SMTP session
+        """
+        if self._async_smtp is not None:
+            try:
+                await self._async_smtp.noop()
+                return self._async_smtp
+            except aiosmtplib.SMTPException:
+                logger.info("Cached async SMTP connection is stale, reconnecting")
+                await self._close_async_smtp()
+        
+        smtp = aiosmtplib.SMTP(hostname=self.host, port=self.port,
+                               use_tls=self.port == 465, start_tls=False, timeout=30)
+        await smtp.connect()
+        if self.use_tls and self.port != 465:
+            await smtp.starttls()
+        await smtp.login(self.email, self.password)
+        self._async_smtp = smtp
+        
+        return smtp
+    
+    async def _close_async_smtp(self) -> None:
+        """
+        Close the cached async SMTP connection, ignoring errors on teardown.
+        """
+        if self._async_smtp is not None:
+            try:
+                await self._async_smtp.quit()
+            except Exception:
+                pass
+            self._async_smtp = None
+    
+    async def send_plan_via_email_async(self, user_info: Dict[str, str], 
+                                      preferences: Dict[str, Any], 
+                                      selected_plan: Dict[str, Any]) -> bool:
+        """
+        Send a finalized travel plan to the business via email without
+        blocking the event loop.
+        
+        Args:
+            user_info (dict): User information (name, email)
+            preferences (dict): User preferences
+            selected_plan (dict): Selected travel plan
+            
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        logger.info("Sending travel plan via email (async) for user {}", user_info.get('name'))
+        
+        if self._email_disabled:
+            logger.error("Email notifications are disabled (missing credentials)")
+            return False
+        
+        try:
+            msg = self._build_message(user_info, preferences, selected_plan)
+            
+            # Serialize sends over the shared connection, reconnecting once
+            # on a dropped session
+            async with self._async_smtp_lock:
                 try:
-                    response = requests.post(api_url, json=payload, timeout=30)
+                    smtp = await self._get_async_smtp()
+                    await smtp.send_message(msg)
+                except aiosmtplib.SMTPServerDisconnected:
+                    logger.warning("Async SMTP send failed on cached connection, reconnecting and retrying")
+                    await self._close_async_smtp()
+                    smtp = await self._get_async_smtp()
+                    await smtp.send_message(msg)
+            
+            logger.info("Email sent successfully to {}", self.recipient)
+            return True
+        
+        except Exception as e:
+            logger.error("Error sending email (async): {}", str(e))
+            return False
+    
+    async def send_plan_via_api_async(self, user_info: Dict[str, str], 
+                                    preferences: Dict[str, Any], 
+                                    selected_plan: Dict[str, Any],
+                                    api_url: str = None) -> bool:
+        """
+        Send a finalized travel plan to the business via API without blocking
+        the event loop.
+        
+        Args:
+            user_info (dict): User information (name, email)
+            preferences (dict): User preferences
+            selected_plan (dict): Selected travel plan
+            api_url (str): API endpoint URL
+            
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        logger.info("Sending travel plan via API (async) for user {}", user_info.get('name'))
+        
+        if not api_url:
+            logger.error("API URL not specified")
+            return False
+        
+        # Create payload, trimming oversized plan fields so the request
+        # body stays predictable
+        payload = {
+            'user_info': user_info,
+            'preferences': preferences,
+            'selected_plan': _trim_plan(selected_plan),
+            'timestamp': self._get_current_timestamp()
+        }
+        
+        # Serialize once before the retry loop; orjson/json raise for
+        # non-serializable values and that is not worth a retry
+        try:
+            body = _dumps(payload)
+        except (TypeError, ValueError) as e:
+            logger.error("Error serializing plan payload: {}", str(e))
+            return False
+
+        session = self._get_aio_session()
+
+        # Send request with retry logic
+        max_retries = 3
+        retry_delay = 2
+
+        for attempt in range(max_retries):
+            try:
+                async with session.post(api_url, data=body,
+                                        headers={'Content-Type': 'application/json'},
+                                        timeout=aiohttp.ClientTimeout(total=30)) as response:
                     response.raise_for_status()
                     
-                    logger.info(f"Plan sent successfully via API: {response.status_code}")
+                    logger.info("Plan sent successfully via API: {}", response.status)
                     return True
-                
-                except requests.exceptions.RequestException as e:
-                    logger.warning(f"API request failed (attempt {attempt+1}/{max_retries}): {str(e)}")
-                    
-                    if attempt < max_retries - 1:
-                        import time
-                        time.sleep(retry_delay)
-                        retry_delay *= 2  # Exponential backoff
-                    else:
-                        logger.error(f"Failed to send plan via API after {max_retries} attempts")
-                        raise
             
-            return False
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                logger.warning("API request failed (attempt {}/{}): {}", attempt + 1, max_retries, str(e))
+                
+                if attempt < max_retries - 1:
+                    await asyncio.sleep(retry_delay)
+                    retry_delay *= 2  # Exponential backoff
         
-        except Exception as e:
-            logger.error(f"Error sending plan via API: {str(e)}")
-            return False
+        logger.error("Failed to send plan via API after {} attempts", max_retries)
+        return False
     
-    def notify_business(self, user_info: Dict[str, str], 
+    def notify_business_batch(self, items: List[tuple]) -> List[bool]:
+        """
+        Send a batch of finalized travel plans over a single SMTP session.
+
+        Reuses one connection for all messages instead of paying TLS + login
+        per item, resetting the session between failures so one bad message
+        does not abort the rest of the batch.
+
+        Args:
+            items (list): Tuples of (user_info, preferences, selected_plan)
+
+        Returns:
+            list: Per-item success flags, in the same order as items
+        """
+        logger.info("Sending batch of {} travel plans via email", len(items))
+
+        if self._email_disabled:
+            logger.error("Email notifications are disabled (missing credentials)")
+            return [False] * len(items)
+
+        results = []
+        sent_on_connection = 0
+
+        # One strftime for the whole batch; the items all leave within
+        # the same session anyway
+        batch_timestamp = self._get_current_timestamp()
+
+        with self._smtp_lock:
+            for user_info, preferences, selected_plan in items:
+                try:
+                    # Rotate the connection periodically; providers throttle
+                    # very long-lived sessions
+                    if sent_on_connection >= 10000:
+                        self._close_smtp()
+                        sent_on_connection = 0
+
+                    # Create email message
+                    raw = self._build_message(user_info, preferences, selected_plan, batch_timestamp).as_bytes()
+
+                    try:
+                        self._get_smtp().sendmail(self.email, [self.recipient], raw)
+                    except smtplib.SMTPServerDisconnected:
+                        self._close_smtp()
+                        self._get_smtp().sendmail(self.email, [self.recipient], raw)
+
+                    sent_on_connection += 1
+                    results.append(True)
+
+                except Exception as e:
+                    logger.error("Error sending batch email for user {}: {}", user_info.get('name'), str(e))
+                    results.append(False)
+
+                    # Reset the session so this failure does not poison
+                    # subsequent sends; drop it if even RSET fails
+                    if self._smtp is not None:
+                        try:
+                            self._smtp.rset()
+                        except Exception:
+                            self._close_smtp()
+
+        logger.info("Batch email complete: {}/{} sent", sum(results), len(items))
+        return results
+
+    def notify_business(self, user_info: Dict[str, str],
                          preferences: Dict[str, Any], 
                          selected_plan: Dict[str, Any],
                          api_url: str = None) -> bool:
@@ -153,84 +721,78 @@ class BusinessNotifier:
         Returns:
             bool: True if at least one method was successful, False otherwise
         """
-        # Try email first
-        email_success = self.send_plan_via_email(user_info, preferences, selected_plan)
-        
-        # Try API if configured
-        api_success = False
+        # Both channels are independent and I/O-bound, so run them in
+        # parallel when the API is configured; total latency becomes
+        # max(email, api) instead of their sum
         if api_url:
-            api_success = self.send_plan_via_api(user_info, preferences, selected_plan, api_url)
+            fut_email = self._executor.submit(self.send_plan_via_email, user_info, preferences, selected_plan)
+            fut_api = self._executor.submit(self.send_plan_via_api, user_info, preferences, selected_plan, api_url)
+            email_success = fut_email.result()
+            api_success = fut_api.result()
+        else:
+            email_success = self.send_plan_via_email(user_info, preferences, selected_plan)
+            api_success = False
         
         # Log outcome
         if email_success or api_success:
-            logger.info(f"Successfully notified business for user {user_info.get('name')}")
+            logger.info("Successfully notified business for user {}", user_info.get('name'))
             return True
         else:
-            logger.error(f"Failed to notify business for user {user_info.get('name')}")
+            logger.error("Failed to notify business for user {}", user_info.get('name'))
             return False
     
-    def _format_email_body(self, user_info: Dict[str, str], 
-                           preferences: Dict[str, Any], 
-                           selected_plan: Dict[str, Any]) -> str:
+    def _format_email_body(self, user_info: Dict[str, str],
+                           preferences: Dict[str, Any],
+                           selected_plan: Dict[str, Any],
+                           timestamp: str = None) -> str:
         """
         Format the email body.
-        
+
         Args:
             user_info (dict): User information (name, email)
             preferences (dict): User preferences
             selected_plan (dict): Selected travel plan
-            
+            timestamp (str): Pre-formatted timestamp to reuse (optional)
+
         Returns:
             str: Formatted email body
         """
-        # Format user information
-        body = "NEW TRAVEL PLAN REQUEST\n"
-        body += "=======================\n\n"
-        
-        body += "USER INFORMATION:\n"
-        body += f"Name: {user_info.get('name', 'Not provided')}\n"
-        body += f"Email: {user_info.get('email', 'Not provided')}\n\n"
-        
-        # Format preferences
-        body += "PREFERENCES:\n"
-        body += f"Trip Type: {preferences.get('trip_type', 'Not specified')}\n"
-        body += f"Duration: {preferences.get('duration', 'Not specified')} days\n"
-        body += f"Travel Month: {preferences.get('travel_month', 'Not specified')}\n"
-        
         interests = preferences.get('interests', [])
-        if interests:
-            body += f"Interests: {', '.join(interests)}\n\n"
-        else:
-            body += "Interests: Not specified\n\n"
-        
-        # Format selected plan
-        body += "SELECTED TRAVEL PLAN:\n"
-        body += f"Title: {selected_plan.get('title', 'Not specified')}\n"
-        body += f"Duration: {selected_plan.get('duration', 'Not specified')}\n"
-        
         description = selected_plan.get('description', selected_plan.get('summary', 'Not specified'))
-        body += f"Description: {description}\n\n"
+        
+        # Collect the sections and join once at the end instead of repeatedly
+        # concatenating a growing string
+        parts = [
+            _EMAIL_HEADER,
+            "USER INFORMATION:",
+            f"Name: {user_info.get('name', 'Not provided')}",
+            f"Email: {user_info.get('email', 'Not provided')}\n",
+            "PREFERENCES:",
+            f"Trip Type: {preferences.get('trip_type', 'Not specified')}",
+            f"Duration: {preferences.get('duration', 'Not specified')} days",
+            f"Travel Month: {preferences.get('travel_month', 'Not specified')}",
+            f"Interests: {', '.join(interests)}\n" if interests else "Interests: Not specified\n",
+            "SELECTED TRAVEL PLAN:",
+            f"Title: {selected_plan.get('title', 'Not specified')}",
+            f"Duration: {selected_plan.get('duration', 'Not specified')}",
+            f"Description: {description}\n",
+        ]
         
         # Add highlights if available
         highlights = selected_plan.get('highlights', [])
         if highlights:
-            body += "Highlights:\n"
-            for highlight in highlights:
-                body += f"- {highlight}\n"
-            body += "\n"
+            parts.append("Highlights:\n" + "\n".join(f"- {highlight}" for highlight in highlights) + "\n")
         
         # Add itinerary if available
         itinerary = selected_plan.get('itinerary', [])
         if itinerary:
-            body += "Itinerary:\n"
-            for day in itinerary:
-                body += f"{day.get('day', 'Day')}: {day.get('description', 'No description')}\n"
-            body += "\n"
+            parts.append("Itinerary:\n" + "\n".join(
+                f"{day.get('day', 'Day')}: {day.get('description', 'No description')}" for day in itinerary
+            ) + "\n")
         
-        body += "Please contact the user to confirm the travel plan and provide additional details.\n"
-        body += f"This request was generated by the Tashi bot at {self._get_current_timestamp()}."
+        parts.append(_EMAIL_FOOTER + f"This request was generated by the Tashi bot at {timestamp or self._get_current_timestamp()}.")
         
-        return body
+        return "\n".join(parts)
     
     def _get_current_timestamp(self) -> str:
         """
@@ -239,5 +801,24 @@ class BusinessNotifier:
         Returns:
             str: Current timestamp
         """
-        import datetime
-        return datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S") 
\ No newline at end of file
+        return datetime.now().strftime(_TS_FMT) 
+# Process-wide notifier so the pooled SMTP/HTTP connections are actually
+# shared by every caller instead of rebuilt per notification
+_default: Optional[BusinessNotifier] = None
+_default_lock = threading.Lock()
+
+def get_notifier() -> BusinessNotifier:
+    """
+    Get the shared BusinessNotifier, creating it on first use.
+    
+    Returns:
+        BusinessNotifier: Process-wide notifier instance
+    """
+    global _default
+    
+    if _default is None:
+        with _default_lock:
+            if _default is None:
+                _default = BusinessNotifier()
+    
+    return _default
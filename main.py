@@ -7,18 +7,46 @@ import signal
 import sys
 import asyncio
 
+# Use the libuv-backed event loop when available; it is a drop-in
+# replacement that speeds up socket-heavy workloads like the scraper
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
+
 from utils.logger import get_logger
-from bot.bot import TashiBot
-from scraper.scraper import BhutanScraper
-from scraper.direct_scraper import DirectBhutanScraper
 
 logger = get_logger("main")
 
+# Cleanup callbacks to run before exiting on a termination signal
+_shutdown_callbacks = []
+
+def register_shutdown_callback(callback):
+    """
+    Register a callback to run during graceful shutdown.
+    
+    Args:
+        callback (callable): Zero-argument cleanup function
+    """
+    _shutdown_callbacks.append(callback)
+
 def handle_sigterm(signum, frame):
     """
-    Handle SIGTERM signal (graceful shutdown).
+    Handle termination signals (graceful shutdown).
+    
+    Runs the registered cleanup callbacks (flushing the notification
+    queue and closing pooled SMTP/HTTP connections) before exiting, so
+    remote servers see clean QUITs instead of half-closed sockets.
     """
-    logger.info("Received SIGTERM signal. Shutting down...")
+    logger.info(f"Received signal {signum}. Shutting down...")
+    
+    for callback in _shutdown_callbacks:
+        try:
+            callback()
+        except Exception as e:
+            logger.error(f"Error in shutdown callback: {str(e)}")
+    
     sys.exit(0)
 
 def parse_arguments():
@@ -36,6 +64,8 @@ def parse_arguments():
     # Scraper command
     scraper_parser = subparsers.add_parser("scrape", help="Run the web scraper")
     scraper_parser.add_argument("--direct", action="store_true", help="Use direct content extraction instead of web scraping")
+    scraper_parser.add_argument("--refresh", action="store_true", help="Bypass the HTTP replay cache and re-fetch all pages")
+    scraper_parser.add_argument("--profile", action="store_true", help="Profile the scrape with cProfile and write scrape.prof (view with snakeviz)")
     
     # Bot command
     bot_parser = subparsers.add_parser("bot", help="Run the Telegram bot")
@@ -45,14 +75,21 @@ def parse_arguments():
     # Parse the arguments
     return parser.parse_args()
 
-async def run_scraper_async():
+async def run_scraper_async(refresh_cache=False):
     """
     Run the web scraper asynchronously.
+
+    Args:
+        refresh_cache (bool): Bypass the HTTP replay cache and re-fetch
     """
     logger.info("Starting scraper")
-    
+
     try:
-        scraper = BhutanScraper()
+        # Imported lazily so other subcommands do not pay the scraper's
+        # import cost
+        from scraper.scraper import BhutanScraper
+
+        scraper = BhutanScraper(refresh_cache=refresh_cache)
         await scraper.run_scraper()
         logger.info("Scraper completed successfully")
     except Exception as e:
@@ -66,6 +103,10 @@ def run_direct_scraper():
     logger.info("Starting direct content extraction")
     
     try:
+        # Imported lazily so other subcommands do not pay the scraper's
+        # import cost
+        from scraper.direct_scraper import DirectBhutanScraper
+        
         scraper = DirectBhutanScraper()
         scraper.run()
         logger.info("Direct scraper completed successfully")
@@ -73,18 +114,34 @@ def run_direct_scraper():
         logger.error(f"Error running direct scraper: {str(e)}")
         sys.exit(1)
 
-def run_scraper(use_direct=False):
+def run_scraper(use_direct=False, refresh_cache=False, profile=False):
     """
     Run the web scraper.
-    
+
     Args:
         use_direct (bool): Whether to use direct content extraction instead of web scraping
+        refresh_cache (bool): Bypass the HTTP replay cache and re-fetch
+        profile (bool): Profile the run with cProfile and write scrape.prof
     """
+    if profile:
+        # Imported here so the normal path pays nothing for profiling
+        import cProfile
+
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            run_scraper(use_direct=use_direct, refresh_cache=refresh_cache)
+        finally:
+            profiler.disable()
+            profiler.dump_stats("scrape.prof")
+            logger.info("Profile written to scrape.prof (view with: snakeviz scrape.prof)")
+        return
+
     if use_direct:
         run_direct_scraper()
     else:
         # Run the async function in the event loop
-        asyncio.run(run_scraper_async())
+        asyncio.run(run_scraper_async(refresh_cache=refresh_cache))
 
 def run_bot(webhook_url=None, state_file=None):
     """
@@ -97,12 +154,20 @@ def run_bot(webhook_url=None, state_file=None):
     logger.info("Starting bot")
     
     try:
-        # Register signal handler for graceful shutdown
+        # Imported lazily so scraper-only invocations skip the telegram
+        # stack entirely
+        from bot.bot import TashiBot
+        
+        # Register signal handlers for graceful shutdown
         signal.signal(signal.SIGTERM, handle_sigterm)
+        signal.signal(signal.SIGINT, handle_sigterm)
         
         # Create the bot
         bot = TashiBot()
         
+        # Flush pending notifications and close pooled connections on exit
+        register_shutdown_callback(bot.business_notifier.close)
+        
         # Load state if specified
         if state_file and os.path.exists(state_file):
             bot.load_state(state_file)
@@ -128,7 +193,7 @@ def main():
     
     # Run the appropriate command
     if args.command == "scrape":
-        run_scraper(use_direct=args.direct)
+        run_scraper(use_direct=args.direct, refresh_cache=args.refresh, profile=args.profile)
     elif args.command == "bot":
         run_bot(args.webhook, args.state_file)
     else:
@@ -2,14 +2,100 @@
 Recommendation engine for matching user preferences with travel options.
 """
 from typing import Dict, List, Any, Optional
+import calendar
+import heapq
 import re
-from datetime import datetime, timedelta
+from functools import lru_cache
+from operator import itemgetter
 
 from storage.data_manager import DataManager
 from utils.logger import get_logger
 
 logger = get_logger("recommendation_engine")
 
+# Digit runs in duration strings like "7 days"; compiled once
+_DIGITS_RE = re.compile(r'\d+')
+
+# Interest score at which an item is clearly relevant; scanning further
+# fields past this point adds no useful ordering signal
+_SCORE_CAP = 12
+
+# Full and abbreviated month names mapped to month numbers; a dict hit
+# replaces the locale-aware strptime call per filter invocation
+_MONTH_LOOKUP = {
+    **{name.lower(): i for i, name in enumerate(calendar.month_name) if name},
+    **{name.lower(): i for i, name in enumerate(calendar.month_abbr) if name},
+}
+
+# Season keywords and the months they cover; used to fold a best_season
+# string into a 12-bit month mask once per item. One compiled
+# alternation per group replaces a substring scan per keyword
+_SEASON_KEYWORD_MONTHS = [
+    (re.compile(r'winter|december|january|february'), (12, 1, 2)),
+    (re.compile(r'spring|march|april|may'), (3, 4, 5)),
+    (re.compile(r'summer|june|july|august'), (6, 7, 8)),
+    (re.compile(r'fall|autumn|september|october|november'), (9, 10, 11)),
+    (re.compile(r'year-round|all year'), tuple(range(1, 13))),
+]
+
+def _ymd_month(date_str: str) -> int:
+    """
+    Extract the month from a "%Y-%m-%d" date string.
+
+    Only the month is needed for travel-month filtering, so a slice
+    parse avoids building a full datetime per date range.
+
+    Args:
+        date_str (str): Date in "%Y-%m-%d" format
+
+    Returns:
+        int: Month number (1-12)
+
+    Raises:
+        ValueError: If the string is not in the expected format
+    """
+    if len(date_str) != 10 or date_str[4] != '-' or date_str[7] != '-':
+        raise ValueError(f"Invalid date format: {date_str}")
+    month = int(date_str[5:7])
+    if not 1 <= month <= 12:
+        raise ValueError(f"Month out of range: {date_str}")
+    return month
+
+def _season_to_mask(season: str) -> int:
+    """
+    Encode a lowercased best_season string as a 12-bit month mask.
+
+    Args:
+        season (str): Lowercased season description
+
+    Returns:
+        int: Bitmask with bit (month - 1) set for each covered month
+    """
+    mask = 0
+    for pattern, months in _SEASON_KEYWORD_MONTHS:
+        if pattern.search(season):
+            for month in months:
+                mask |= 1 << (month - 1)
+    return mask
+
+@lru_cache(maxsize=64)
+def _interest_pattern(interests: tuple) -> "re.Pattern":
+    """
+    Build a multi-keyword matcher for a tuple of lowercased interests.
+
+    One compiled alternation scans each text field in a single linear
+    pass instead of one substring search per interest. Longer keywords
+    come first so a keyword containing a shorter one is still reported.
+
+    Args:
+        interests (tuple): Lowercased interest keywords
+
+    Returns:
+        re.Pattern: Compiled alternation over the keywords
+    """
+    ordered = sorted(interests, key=len, reverse=True)
+    return re.compile('|'.join(re.escape(keyword) for keyword in ordered))
+
 class RecommendationEngine:
     """
     Engine for matching user preferences with travel options.
@@ -56,53 +142,58 @@ class RecommendationEngine:
             logger.warning(f"No data found for data type: {data_type}")
             return []
         
+        # Interest scores for this query live in a side table keyed by
+        # id(item); cached items are shared between queries, so storing
+        # scores on them would leak one query's scores into the next
+        scores = {}
+
         # For trekking, we want to show all options without filtering too much
         if trip_type == 'trekking':
             # If we specifically want all trek options without filtering
             if preferences.get('show_all_options', False):
                 logger.info("Returning all trek options without filtering")
                 return data
-                
+
             # Filter by interests but don't filter by duration/month
             # This ensures all treks are shown but ordered by relevance
-            filtered_data = self._filter_by_interests(data, preferences.get('interests', []))
-            sorted_data = self._sort_by_relevance(filtered_data, preferences)
-            
+            filtered_data = self._filter_by_interests(data, preferences.get('interests', []), scores)
+            sorted_data = self._sort_by_relevance(filtered_data, preferences, scores)
+
             # If we have fewer than 3 recommendations after filtering, return all treks
             if len(sorted_data) < 3:
                 logger.info(f"Only {len(sorted_data)} treks after filtering, returning all {len(data)} treks")
-                return self._sort_by_relevance(data, preferences)
-                
+                return self._sort_by_relevance(data, preferences, scores)
+
             return sorted_data
-        
+
         # For other trip types, apply all filters
         filtered_data = data
-        
+
         # Filter by duration
         if 'duration' in preferences:
             filtered_data = [
-                item for item in filtered_data 
+                item for item in filtered_data
                 if abs(item.get('duration', item.get('duration_days', 0)) - preferences['duration']) <= 2
             ]
-        
+
         # Filter by travel month
         if 'travel_month' in preferences:
             filtered_data = self._filter_by_travel_month(filtered_data, preferences['travel_month'])
-        
+
         # Filter by interests
         if 'interests' in preferences:
-            filtered_data = self._filter_by_interests(filtered_data, preferences['interests'])
-        
+            filtered_data = self._filter_by_interests(filtered_data, preferences['interests'], scores)
+
         # Sort by relevance
-        sorted_data = self._sort_by_relevance(filtered_data, preferences)
-        
+        sorted_data = self._sort_by_relevance(filtered_data, preferences, scores)
+
         # If we have fewer than 3 recommendations after filtering, apply less strict filtering
         if len(sorted_data) < 3:
             logger.info("Few recommendations after filtering, applying less strict filtering")
             filtered_data = data
-            
+
             # Sort by relevance without strict filtering
-            sorted_data = self._sort_by_relevance(filtered_data, preferences)
+            sorted_data = self._sort_by_relevance(filtered_data, preferences, scores)
         
         logger.info(f"Generated {len(sorted_data)} recommendations")
         return sorted_data
@@ -118,45 +209,53 @@ class RecommendationEngine:
             list: List of recommended travel options
         """
         all_results = []
-        
+        scores = {}
+
+        # Parse the preferences once; the same values apply to every
+        # data type in the loop below
+        min_days = max_days = None
+        duration = preferences.get('duration')
+        if duration:
+            try:
+                duration_days = int(duration)
+                # Allow for some flexibility in duration (±2 days)
+                min_days = max(1, duration_days - 2)
+                max_days = duration_days + 2
+            except (ValueError, TypeError):
+                logger.warning(f"Invalid duration value: {duration}")
+
+        travel_month = preferences.get('travel_month')
+        interests = preferences.get('interests', [])
+
         # Check each data type
         for data_type in ['tours', 'festivals', 'trekking', 'itineraries']:
-            # Get base data
-            data = self.data_manager.load_data(data_type)
-            
-            # Filter by duration if specified
-            duration = preferences.get('duration')
-            if duration:
-                try:
-                    duration_days = int(duration)
-                    # Allow for some flexibility in duration (±2 days)
-                    min_days = max(1, duration_days - 2)
-                    max_days = duration_days + 2
-                    data = self.data_manager.filter_by_duration(data_type, min_days, max_days)
-                except (ValueError, TypeError):
-                    logger.warning(f"Invalid duration value: {duration}")
-            
+            # Filter by duration if specified, otherwise take the base data
+            if min_days is not None:
+                data = self.data_manager.filter_by_duration(data_type, min_days, max_days)
+            else:
+                data = self.data_manager.load_data(data_type)
+
             # Filter by travel month if specified
-            travel_month = preferences.get('travel_month')
             if travel_month:
                 data = self._filter_by_travel_month(data, travel_month)
-            
+
             # Filter by interests if specified
-            interests = preferences.get('interests', [])
             if interests:
-                data = self._filter_by_interests(data, interests)
-            
+                data = self._filter_by_interests(data, interests, scores)
+
             # Add data type as source
             for item in data:
                 item['source'] = data_type
-            
+
             all_results.extend(data)
-        
-        # Sort all results by relevance
-        sorted_results = self._sort_by_relevance(all_results, preferences)
-        
-        # Limit to top 10 recommendations
-        top_results = sorted_results[:10]
+
+        # Score all results, then take the top 10 without paying for a
+        # full sort of the aggregated list
+        totals = self._score_by_relevance(all_results, preferences, scores)
+        top_results = [
+            item for item, _ in
+            heapq.nlargest(10, zip(all_results, totals), key=itemgetter(1))
+        ]
         
         logger.info(f"Generated {len(top_results)} custom recommendations")
         return top_results
@@ -174,40 +273,34 @@ class RecommendationEngine:
         """
         filtered_data = []
         
-        # Try to parse the month
-        try:
-            # Convert month name to month number
-            target_month = datetime.strptime(travel_month, "%B").month
-        except ValueError:
+        # Resolve full/short month names via the precomputed lookup,
+        # falling back to a bare month number
+        target_month = _MONTH_LOOKUP.get(str(travel_month).strip().lower())
+        if target_month is None:
             try:
-                # Try short month name
-                target_month = datetime.strptime(travel_month, "%b").month
-            except ValueError:
-                try:
-                    # Try month number
-                    target_month = int(travel_month)
-                    if target_month < 1 or target_month > 12:
-                        raise ValueError("Month number out of range")
-                except ValueError:
-                    logger.warning(f"Invalid month format: {travel_month}")
-                    return data  # Return original data if month is invalid
+                target_month = int(travel_month)
+                if target_month < 1 or target_month > 12:
+                    raise ValueError("Month number out of range")
+            except (ValueError, TypeError):
+                logger.warning(f"Invalid month format: {travel_month}")
+                return data  # Return original data if month is invalid
         
+        target_bit = 1 << (target_month - 1)
+
         # Filter based on best season or available dates
         for item in data:
             # Check if item has season information
             season = item.get('best_season', '').lower()
-            
-            # Map seasons to months (approximate)
+
             if season:
-                if target_month in [12, 1, 2] and any(s in season for s in ['winter', 'december', 'january', 'february']):
-                    filtered_data.append(item)
-                elif target_month in [3, 4, 5] and any(s in season for s in ['spring', 'march', 'april', 'may']):
-                    filtered_data.append(item)
-                elif target_month in [6, 7, 8] and any(s in season for s in ['summer', 'june', 'july', 'august']):
-                    filtered_data.append(item)
-                elif target_month in [9, 10, 11] and any(s in season for s in ['fall', 'autumn', 'september', 'october', 'november']):
-                    filtered_data.append(item)
-                elif 'year-round' in season or 'all year' in season:
+                # Fold the season string into a month bitmask once per
+                # item; repeat filters are then a single AND
+                mask = item.get('_season_mask')
+                if mask is None:
+                    mask = _season_to_mask(season)
+                    item['_season_mask'] = mask
+
+                if mask & target_bit:
                     filtered_data.append(item)
             else:
                 # If no season information, check if item has specific dates
@@ -220,12 +313,14 @@ class RecommendationEngine:
                             
                             if start_date and end_date:
                                 try:
-                                    start = datetime.strptime(start_date, "%Y-%m-%d")
-                                    end = datetime.strptime(end_date, "%Y-%m-%d")
-                                    
+                                    # Only the months matter here, so slice
+                                    # them out instead of building datetimes
+                                    start_month = _ymd_month(start_date)
+                                    end_month = _ymd_month(end_date)
+
                                     # Check if the target month falls within this date range
-                                    if (start.month <= target_month <= end.month) or \
-                                       (end.month < start.month and (target_month >= start.month or target_month <= end.month)):
+                                    if (start_month <= target_month <= end_month) or \
+                                       (end_month < start_month and (target_month >= start_month or target_month <= end_month)):
                                         filtered_data.append(item)
                                         break
                                 except ValueError:
@@ -238,82 +333,146 @@ class RecommendationEngine:
         logger.info(f"Filtered {len(data)} items to {len(filtered_data)} based on travel month {travel_month}")
         return filtered_data if filtered_data else data  # Return original data if no matches
     
-    def _filter_by_interests(self, data: List[Dict[str, Any]], interests: List[str]) -> List[Dict[str, Any]]:
+    def _filter_by_interests(self, data: List[Dict[str, Any]], interests: List[str],
+                             scores: Optional[Dict[int, int]] = None) -> List[Dict[str, Any]]:
         """
         Filter data by user interests.
-        
+
         Args:
             data (list): List of travel options
             interests (list): List of user interests
-            
+            scores (dict): Optional side table mapping id(item) to the
+                interest score computed here, for later relevance boosts
+
         Returns:
             list: Filtered list of travel options
         """
         if not interests:
             return data
+
+        if scores is None:
+            scores = {}
         
-        # Convert interests to lowercase for case-insensitive matching
-        interests_lower = [interest.lower() for interest in interests]
-        
+        # Convert interests to lowercase for case-insensitive matching,
+        # then compile them into one multi-keyword matcher; each field is
+        # scanned once regardless of how many interests there are
+        pattern = _interest_pattern(tuple(sorted({interest.lower() for interest in interests})))
+
         matching_items = []
-        
+
         for item in data:
             item_score = 0
+
+            # Lowercase each text field once per item lifetime; repeat
+            # queries reuse the cached copies instead of reallocating
+            title = item.get('_title_lc')
+            if title is None:
+                title = item.get('title', '').lower()
+                item['_title_lc'] = title
+
+            description = item.get('_desc_lc')
+            if description is None:
+                description = item.get('description', '').lower()
+                item['_desc_lc'] = description
+
+            highlights = item.get('_highlights_lc')
+            if highlights is None:
+                highlights = [highlight.lower() for highlight in item.get('highlights', [])]
+                item['_highlights_lc'] = highlights
+
+            # Check title (higher weight for title matches)
+            item_score += 3 * len(set(pattern.findall(title)))
+
+            # Check description (medium weight for description matches);
+            # skip once the item has already scored past the cap
+            if item_score < _SCORE_CAP:
+                item_score += 2 * len(set(pattern.findall(description)))
+
+            # Check highlights (lower weight for highlight matches)
+            if item_score < _SCORE_CAP:
+                for highlight in highlights:
+                    item_score += len(set(pattern.findall(highlight)))
+                    if item_score >= _SCORE_CAP:
+                        break
             
-            # Check title
-            title = item.get('title', '').lower()
-            for interest in interests_lower:
-                if interest in title:
-                    item_score += 3  # Higher weight for title matches
-            
-            # Check description
-            description = item.get('description', '').lower()
-            for interest in interests_lower:
-                if interest in description:
-                    item_score += 2  # Medium weight for description matches
-            
-            # Check highlights
-            highlights = item.get('highlights', [])
-            for highlight in highlights:
-                highlight_lower = highlight.lower()
-                for interest in interests_lower:
-                    if interest in highlight_lower:
-                        item_score += 1  # Lower weight for highlight matches
-            
-            # If the item has any matches, add it to the results with its score
+            # If the item has any matches, record its score in the side
+            # table rather than on the (cached, shared) item itself
             if item_score > 0:
-                item['relevance_score'] = item_score
+                scores[id(item)] = item_score
                 matching_items.append(item)
-        
+
         # Sort by relevance score (highest first)
-        matching_items.sort(key=lambda x: x.get('relevance_score', 0), reverse=True)
-        
+        matching_items.sort(key=lambda x: scores[id(x)], reverse=True)
+
         logger.info(f"Filtered {len(data)} items to {len(matching_items)} based on interests {interests}")
         return matching_items if matching_items else data  # Return original data if no matches
     
-    def _sort_by_relevance(self, data: List[Dict[str, Any]], preferences: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def _sort_by_relevance(self, data: List[Dict[str, Any]], preferences: Dict[str, Any],
+                           scores: Optional[Dict[int, int]] = None) -> List[Dict[str, Any]]:
         """
         Sort data by relevance to user preferences.
-        
+
         Args:
             data (list): List of travel options
             preferences (dict): User preferences
-            
+            scores (dict): Optional side table of interest scores keyed
+                by id(item), as produced by _filter_by_interests
+
         Returns:
             list: Sorted list of travel options
         """
-        # Copy the data to avoid modifying the original
-        sorted_data = data.copy()
-        
-        for item in sorted_data:
-            relevance_score = item.get('relevance_score', 0)
-            
+        totals = self._score_by_relevance(data, preferences, scores or {})
+
+        # Sort by relevance score (highest first); sorted() is stable,
+        # so ties keep their original order
+        return [
+            item for item, _ in
+            sorted(zip(data, totals), key=itemgetter(1), reverse=True)
+        ]
+
+    def _score_by_relevance(self, data: List[Dict[str, Any]], preferences: Dict[str, Any],
+                            scores: Dict[int, int]) -> List[int]:
+        """
+        Compute duration-boosted relevance scores for each item.
+
+        Scores are kept out of the items and returned as a list parallel
+        to the input so callers can sort or select on them; the only
+        thing written back is the _duration_days parse cache.
+
+        Args:
+            data (list): List of travel options to score
+            preferences (dict): User preferences
+            scores (dict): Side table of interest scores keyed by id(item)
+
+        Returns:
+            list: Relevance score for each item, in input order
+        """
+        # Parse the preferred duration once instead of per item
+        pref_duration = None
+        if 'duration' in preferences:
+            try:
+                pref_duration = int(preferences['duration'])
+            except (ValueError, TypeError):
+                pass
+
+        totals = []
+        for item in data:
+            relevance_score = scores.get(id(item), 0)
+
             # Boost score for duration match
-            if 'duration' in preferences and 'duration' in item:
-                try:
-                    pref_duration = int(preferences['duration'])
-                    item_duration = int(''.join(filter(str.isdigit, item['duration'])))
-                    
+            if pref_duration is not None and 'duration' in item:
+                # Parse the duration string once per item and cache the
+                # result (None when unparseable), like _season_mask
+                if '_duration_days' in item:
+                    item_duration = item['_duration_days']
+                else:
+                    try:
+                        item_duration = int(''.join(_DIGITS_RE.findall(item['duration'])))
+                    except (ValueError, TypeError):
+                        item_duration = None
+                    item['_duration_days'] = item_duration
+
+                if item_duration is not None:
                     # Exact match gets highest boost
                     if item_duration == pref_duration:
                         relevance_score += 5
@@ -323,17 +482,11 @@ class RecommendationEngine:
                     # Further match gets small boost
                     elif abs(item_duration - pref_duration) <= 4:
                         relevance_score += 1
-                except (ValueError, TypeError):
-                    pass
-            
-            # Update the relevance score
-            item['relevance_score'] = relevance_score
-        
-        # Sort by relevance score (highest first)
-        sorted_data.sort(key=lambda x: x.get('relevance_score', 0), reverse=True)
-        
-        return sorted_data
-    
+
+            totals.append(relevance_score)
+
+        return totals
+
     def get_recommendation_details(self, recommendation_id: str, source: str) -> Optional[Dict[str, Any]]:
         """
         Get detailed information for a specific recommendation.
@@ -345,4 +498,17 @@ class RecommendationEngine:
         Returns:
             dict or None: Detailed information if found, None otherwise
         """
-        return self.data_manager.get_by_id(source, recommendation_id) 
\ No newline at end of file
+        return self.data_manager.get_by_id(source, recommendation_id)
+
+@lru_cache(maxsize=1)
+def get_engine() -> RecommendationEngine:
+    """
+    Get the shared RecommendationEngine, creating it on first use.
+
+    Every caller then reuses one DataManager and its loaded-data caches
+    instead of rebuilding both per message.
+
+    Returns:
+        RecommendationEngine: Process-wide engine instance
+    """
+    return RecommendationEngine()
\ No newline at end of file
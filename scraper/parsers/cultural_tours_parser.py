@@ -1,13 +1,61 @@
 """
 Parser for cultural tours content from the Breathe Bhutan website.
 """
+import soupsieve
 from bs4 import BeautifulSoup
-from urllib.parse import urljoin
+from urllib.parse import urljoin, urlsplit
 
 from utils.logger import get_logger
 
 logger = get_logger("cultural_tours_parser")
 
+# CSS selectors compiled once at import; select_one/select re-run the
+# soupsieve compiler on the selector string at every call otherwise
+_SEL_TOUR_ITEM = soupsieve.compile('.tour-item')
+_SEL_TITLE = soupsieve.compile('.tour-title')
+_SEL_SUMMARY = soupsieve.compile('.tour-description')
+_SEL_DURATION = soupsieve.compile('.tour-duration')
+_SEL_PRICING = soupsieve.compile('.tour-pricing')
+_SEL_DETAIL_LINK = soupsieve.compile('a.tour-link')
+_SEL_ITINERARY_DAY = soupsieve.compile('.itinerary-day')
+_SEL_IMG = soupsieve.compile('img')
+
+# Top-level detail sections located with one walk of the page; pages
+# that omit sections then skip those extractions entirely
+_TOP_SECTION_CLASSES = ('tour-description-full', 'tour-gallery', 'tour-itinerary')
+_SEL_TOP_SECTIONS = soupsieve.compile(
+    '.tour-description-full, .tour-gallery, .tour-itinerary')
+
+# The three list sections share one combined query; each item is
+# bucketed by the class of its enclosing section
+_SECTION_CLASSES = ('tour-highlights', 'tour-included', 'tour-excluded')
+_SEL_SECTION_ITEMS = soupsieve.compile(
+    '.tour-highlights li, .tour-included li, .tour-excluded li')
+
+# Field classes inside one itinerary day; collected in a single tree
+# walk and bucketed by class instead of one traversal per field
+_DAY_FIELD_CLASSES = ('day-title', 'day-description', 'day-activity',
+                      'day-accommodation', 'day-meals')
+
+def _text(parent, pattern, default=""):
+    """
+    Select one element under parent and return its stripped text.
+
+    get_text(strip=True) strips while walking the subtree, skipping the
+    intermediate joined string and .strip() copy that .text.strip()
+    allocates.
+
+    Args:
+        parent (Tag): Element to search under
+        pattern (SoupSieve): Precompiled selector
+        default (str): Value returned when no element matches
+
+    Returns:
+        str: Stripped text content, or the default
+    """
+    elem = pattern.select_one(parent)
+    return elem.get_text(strip=True) if elem else default
+
 class CulturalToursParser:
     """
     Parser for extracting cultural tours information from HTML content.
@@ -21,7 +69,29 @@ class CulturalToursParser:
             base_url (str): Base URL of the website
         """
         self.base_url = base_url
-    
+
+        # Split the base once; urljoin re-parses it for every link and
+        # image otherwise, and most site URLs are absolute or
+        # root-relative anyway
+        split = urlsplit(base_url)
+        self._base_prefix = f"{split.scheme}://{split.netloc}"
+
+    def _abs_url(self, url):
+        """
+        Resolve a possibly-relative URL against the base URL.
+
+        Args:
+            url (str): Absolute or relative URL from a page attribute
+
+        Returns:
+            str: Absolute URL
+        """
+        if url.startswith(('http://', 'https://')):
+            return url
+        if url.startswith('/') and not url.startswith('//'):
+            return self._base_prefix + url
+        return urljoin(self.base_url, url)
+
     def parse_tours_list(self, soup):
         """
         Parse the main cultural tours list page.
@@ -35,28 +105,25 @@ class CulturalToursParser:
         tours_list = []
         
         # Find all tour items on the page (adjust selector based on actual HTML structure)
-        tour_items = soup.select('.tour-item')
-        
+        tour_items = _SEL_TOUR_ITEM.select(soup)
+
         for item in tour_items:
             try:
                 # Extract basic info from list page
-                title = item.select_one('.tour-title').text.strip()
-                summary = item.select_one('.tour-description').text.strip()
-                
+                title = _SEL_TITLE.select_one(item).get_text(strip=True)
+                summary = _SEL_SUMMARY.select_one(item).get_text(strip=True)
+
                 # Try to extract duration and pricing information
-                duration = item.select_one('.tour-duration')
-                duration_text = duration.text.strip() if duration else "Duration not specified"
-                
-                pricing = item.select_one('.tour-pricing')
-                pricing_text = pricing.text.strip() if pricing else "Pricing not specified"
-                
+                duration_text = _text(item, _SEL_DURATION, "Duration not specified")
+                pricing_text = _text(item, _SEL_PRICING, "Pricing not specified")
+
                 # Extract detail page URL
-                detail_link = item.select_one('a.tour-link')
+                detail_link = _SEL_DETAIL_LINK.select_one(item)
                 if detail_link and 'href' in detail_link.attrs:
                     detail_url = detail_link['href']
-                    full_detail_url = urljoin(self.base_url, detail_url)
+                    full_detail_url = self._abs_url(detail_url)
                 else:
-                    logger.warning(f"No detail URL found for tour: {title}")
+                    logger.warning("No detail URL found for tour: {}", title)
                     full_detail_url = None
                 
                 tour_basic_info = {
@@ -70,7 +137,7 @@ class CulturalToursParser:
                 tours_list.append(tour_basic_info)
                 
             except Exception as e:
-                logger.error(f"Error parsing tour item: {str(e)}")
+                logger.error("Error parsing tour item: {}", e)
         
         return tours_list
     
@@ -89,45 +156,50 @@ class CulturalToursParser:
             # Start with the basic info
             tour_data = basic_info.copy()
             
+            # Locate the remaining top-level sections in one walk; absent
+            # sections cost nothing beyond this pass
+            found = {}
+            for node in _SEL_TOP_SECTIONS.select(soup):
+                for cls in node.get('class', ()):
+                    if cls in _TOP_SECTION_CLASSES and cls not in found:
+                        found[cls] = node
+
             # Extract detailed description
-            description_elem = soup.select_one('.tour-description-full')
+            description_elem = found.get('tour-description-full')
             if description_elem:
-                tour_data['description'] = description_elem.text.strip()
-            
-            # Extract tour highlights
-            highlights = []
-            highlights_section = soup.select_one('.tour-highlights')
-            if highlights_section:
-                highlight_items = highlights_section.select('li')
-                highlights = [item.text.strip() for item in highlight_items]
-            tour_data['highlights'] = highlights
-            
+                description = description_elem.get_text(strip=True)
+                if description:
+                    tour_data['description'] = description
+
+            # Extract highlights/included/excluded with one combined
+            # query, bucketing each item by its enclosing section class
+            sections = {}
+            for li in _SEL_SECTION_ITEMS.select(soup):
+                section = li.find_parent(class_=_SECTION_CLASSES)
+                if section is None:
+                    continue
+                for cls in section.get('class', ()):
+                    if cls in _SECTION_CLASSES:
+                        sections.setdefault(cls, []).append(li.get_text(strip=True))
+                        break
+
+            tour_data['highlights'] = sections.get('tour-highlights', [])
+
             # Extract itinerary
-            tour_data['itinerary'] = self._extract_itinerary(soup)
-            
+            tour_data['itinerary'] = self._extract_itinerary(found.get('tour-itinerary'))
+
             # Extract included/excluded items
-            included = []
-            included_section = soup.select_one('.tour-included')
-            if included_section:
-                included_items = included_section.select('li')
-                included = [item.text.strip() for item in included_items]
-            tour_data['included'] = included
-            
-            excluded = []
-            excluded_section = soup.select_one('.tour-excluded')
-            if excluded_section:
-                excluded_items = excluded_section.select('li')
-                excluded = [item.text.strip() for item in excluded_items]
-            tour_data['excluded'] = excluded
-            
+            tour_data['included'] = sections.get('tour-included', [])
+            tour_data['excluded'] = sections.get('tour-excluded', [])
+
             # Extract images
             images = []
-            gallery_section = soup.select_one('.tour-gallery')
+            gallery_section = found.get('tour-gallery')
             if gallery_section:
-                image_elements = gallery_section.select('img')
+                image_elements = _SEL_IMG.select(gallery_section)
                 for img in image_elements:
                     if 'src' in img.attrs:
-                        image_url = urljoin(self.base_url, img['src'])
+                        image_url = self._abs_url(img['src'])
                         alt_text = img.get('alt', '')
                         images.append({
                             'url': image_url,
@@ -141,54 +213,62 @@ class CulturalToursParser:
             return tour_data
             
         except Exception as e:
-            logger.error(f"Error parsing tour details: {str(e)}")
+            logger.error("Error parsing tour details: {}", e)
             # Return basic info if there was an error parsing details
             return basic_info
     
-    def _extract_itinerary(self, soup):
+    def _extract_itinerary(self, itinerary_section):
         """
-        Extract itinerary details from a tour page.
-        
+        Extract itinerary details from a tour page's itinerary section.
+
         Args:
-            soup (BeautifulSoup): Parsed HTML content
-            
+            itinerary_section (Tag): The .tour-itinerary element, or None
+                when the page has no itinerary
+
         Returns:
             list: List of daily itinerary items
         """
         itinerary_items = []
-        
-        # Find the itinerary section
-        itinerary_section = soup.select_one('.tour-itinerary')
-        if not itinerary_section:
+
+        if itinerary_section is None:
             logger.warning("No itinerary section found")
             return itinerary_items
-        
+
         # Find all day elements in the itinerary section
-        day_elements = itinerary_section.select('.itinerary-day')
-        
+        day_elements = _SEL_ITINERARY_DAY.select(itinerary_section)
+
         for day_element in day_elements:
             try:
+                # Collect every field node in one walk of the day
+                # element and bucket by class, instead of one full
+                # traversal per field
+                buckets = {}
+                for node in day_element.find_all(class_=_DAY_FIELD_CLASSES):
+                    for cls in node.get('class', ()):
+                        if cls in _DAY_FIELD_CLASSES:
+                            buckets.setdefault(cls, []).append(node)
+
                 # Extract day number/title
-                day_title_elem = day_element.select_one('.day-title')
-                day_title = day_title_elem.text.strip() if day_title_elem else "Day"
-                
+                day_titles = buckets.get('day-title')
+                day_title = day_titles[0].get_text(strip=True) if day_titles else "Day"
+
                 # Extract day description
-                day_desc_elem = day_element.select_one('.day-description')
-                day_description = day_desc_elem.text.strip() if day_desc_elem else ""
-                
+                day_descs = buckets.get('day-description')
+                day_description = day_descs[0].get_text(strip=True) if day_descs else ""
+
                 # Extract activities or points of interest
-                activities = []
-                activities_elem = day_element.select('.day-activity')
-                for activity in activities_elem:
-                    activities.append(activity.text.strip())
-                
+                activities = [
+                    activity.get_text(strip=True)
+                    for activity in buckets.get('day-activity', [])
+                ]
+
                 # Extract accommodation details
-                accommodation_elem = day_element.select_one('.day-accommodation')
-                accommodation = accommodation_elem.text.strip() if accommodation_elem else "Not specified"
-                
+                accommodations = buckets.get('day-accommodation')
+                accommodation = accommodations[0].get_text(strip=True) if accommodations else "Not specified"
+
                 # Extract meals included
-                meals_elem = day_element.select_one('.day-meals')
-                meals = meals_elem.text.strip() if meals_elem else "Not specified"
+                meals_elems = buckets.get('day-meals')
+                meals = meals_elems[0].get_text(strip=True) if meals_elems else "Not specified"
                 
                 itinerary_items.append({
                     'day': day_title,
@@ -199,6 +279,6 @@ class CulturalToursParser:
                 })
                 
             except Exception as e:
-                logger.error(f"Error extracting itinerary day: {str(e)}")
+                logger.error("Error extracting itinerary day: {}", e)
         
         return itinerary_items 
\ No newline at end of file
@@ -2,95 +2,468 @@
 Main scraper functionality for extracting data from the Breathe Bhutan website.
 """
 import os
+import base64
+import gzip
+import hashlib
 import json
+import re
 import time
 import asyncio
-from typing import Dict, List, Any
-from playwright.async_api import async_playwright
-from urllib.parse import urljoin
+import aiohttp
+from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeoutError
+from urllib.parse import urljoin, urlsplit, urlunsplit, parse_qsl, urlencode
 from bs4 import BeautifulSoup
 from tqdm import tqdm
 
+# orjson serializes several times faster than the stdlib; fall back
+# silently when it is not installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# lxml parses HTML at C speed; fall back to the pure-Python parser
+# when it is not installed
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
 import config
 from utils.logger import get_logger
 
 logger = get_logger("scraper")
 
+# Maximum number of pages rendered concurrently; each request gets its own
+# BrowserContext inside the single shared browser
+MAX_CONCURRENT_PAGES = 8
+
+# Minimum DOM the extractors need before page.content() is useful; waiting
+# for this is much cheaper than waiting for full network idle
+CONTENT_READY_SELECTOR = '.entry-content, article, .content-block, h1'
+
+USER_AGENT = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36'
+
+# Response headers that describe the wire encoding of the original
+# transfer; they no longer apply to the decoded cached body
+VOLATILE_RESPONSE_HEADERS = ('content-encoding', 'content-length', 'transfer-encoding')
+
+# Resource types the extractors never read; image src attributes stay
+# visible in the DOM even when the bytes are never fetched
+BLOCKED_RESOURCE_TYPES = {'image', 'media', 'font', 'stylesheet'}
+
+# Third-party hosts that only serve analytics/tracking
+BLOCKED_HOSTS = ('google-analytics', 'googletagmanager', 'doubleclick', 'facebook.net', 'hotjar')
+
+# Strip browser features that only cost CPU/memory for headless text
+# extraction (GPU, sync, background throttling, bundled extensions)
+BROWSER_ARGS = [
+    '--disable-gpu',
+    '--disable-dev-shm-usage',
+    '--disable-features=Translate,BackForwardCache,AcceptCHFrame',
+    '--disable-extensions',
+    '--disable-background-networking',
+    '--disable-default-apps',
+    '--disable-sync',
+    '--no-first-run',
+    '--no-default-browser-check',
+    '--mute-audio',
+    '--disable-component-extensions-with-background-pages',
+    '--disable-renderer-backgrounding',
+    '--disable-backgrounding-occluded-windows',
+    '--disable-ipc-flooding-protection',
+]
+
+# Output paths for the secondary content sections, joined once so the
+# scrape tasks and the consolidation step agree on the same files
+HOMEPAGE_FILE = os.path.join(config.DATA_DIR, "homepage.json")
+REVIEWS_FILE = os.path.join(config.DATA_DIR, "reviews.json")
+TESTIMONIALS_FILE = os.path.join(config.DATA_DIR, "testimonials.json")
+ABOUT_FILE = os.path.join(config.DATA_DIR, "about.json")
+FAQ_FILE = os.path.join(config.DATA_DIR, "faq.json")
+TRAVEL_GUIDE_FILE = os.path.join(config.DATA_DIR, "travel_guide.json")
+REGIONS_FILE = os.path.join(config.DATA_DIR, "regions.json")
+GENERAL_INFO_FILE = os.path.join(config.DATA_DIR, "general_info.json")
+
+# Compiled once at import; the extractors run these against every
+# scraped block of text
+DURATION_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r'(\d+)[\s-]day',
+        r'(\d+)[\s-]days',
+        r'tour of (\d+) days',
+        r'for (\d+) days',
+    )
+]
+DAY_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r'Day (\d+)[:\-]([^\n]+)',
+        r'Day (\d+)\.([^\n]+)',
+        r'(\d+)st day[:\-]([^\n]+)',
+        r'(\d+)nd day[:\-]([^\n]+)',
+        r'(\d+)rd day[:\-]([^\n]+)',
+        r'(\d+)th day[:\-]([^\n]+)',
+    )
+]
+SECTION_SPLIT_RE = re.compile(r'\n\n|\r\n\r\n')
+
+# Keyword alternations for classifying content blocks; one C-level scan
+# replaces a Python any() over substring checks (and the .lower() copies)
+FESTIVAL_KEYWORDS_RE = re.compile(r'festival|tshechu|celebration|traditional|ceremony', re.IGNORECASE)
+TREK_KEYWORDS_RE = re.compile(r'trek|hiking|trail|mountain|hike|walk', re.IGNORECASE)
+ITINERARY_KEYWORDS_RE = re.compile(r'day|itinerary|schedule|plan|tour', re.IGNORECASE)
+DAY_MARKER_RE = re.compile(r'day|morning|afternoon|evening', re.IGNORECASE)
+
+# Query parameters that vary between otherwise-identical requests
+# (cache busters and campaign tags); stripped before cache keying
+VOLATILE_QUERY_PARAMS = ('_', 'utm_source', 'utm_medium', 'utm_campaign', 'utm_term', 'utm_content')
+
+def _normalize_cache_url(url):
+    """
+    Normalize a URL for cache keying by dropping volatile query params.
+
+    Args:
+        url (str): URL to normalize
+
+    Returns:
+        str: Normalized URL
+    """
+    scheme, netloc, path, query, _fragment = urlsplit(url)
+    params = [(k, v) for k, v in parse_qsl(query, keep_blank_values=True)
+              if k not in VOLATILE_QUERY_PARAMS]
+    return urlunsplit((scheme, netloc, path, urlencode(params), ''))
+
 class BhutanScraper:
     """
     Scraper for extracting tour data from the Breathe Bhutan website.
     """
-    
-    def __init__(self, base_url=config.BASE_URL):
+
+    def __init__(self, base_url=config.BASE_URL, refresh_cache=False):
         """
         Initialize the scraper.
-        
+
         Args:
             base_url (str): Base URL of the website to scrape
+            refresh_cache (bool): Bypass the HTTP replay cache and re-fetch
         """
         self.base_url = base_url
-        
-        # Ensure data directory exists
+        self.refresh_cache = refresh_cache
+
+        # Shared browser and context for the whole run; every page is
+        # same-origin, so one context lets them share DNS, TLS sessions,
+        # and the HTTP connection pool
+        self._playwright = None
+        self._browser = None
+        self._context = None
+        self._browser_lock = asyncio.Lock()
+        self._semaphore = asyncio.Semaphore(MAX_CONCURRENT_PAGES)
+
+        # Plain HTTP session for pages that render server-side; the
+        # browser is only used when the fast path comes back empty
+        self._http_session = None
+        self._http_lock = asyncio.Lock()
+
+        # Ensure data and HTTP cache directories exist
         os.makedirs(config.DATA_DIR, exist_ok=True)
-        
+        os.makedirs(config.HTTP_CACHE_DIR, exist_ok=True)
+
         logger.info(f"Scraper initialized with base URL: {base_url}")
-    
-    async def _setup_browser(self):
+
+    async def _get_browser(self):
         """
-        Set up a Playwright browser for scraping.
-        
+        Get the shared Playwright browser, launching it on first use.
+
         Returns:
-            tuple: Playwright, Browser, and Page objects
-        """
-        playwright = await async_playwright().start()
-        browser = await playwright.chromium.launch(headless=True)
-        context = await browser.new_context(
-            viewport={'width': 1920, 'height': 1080},
-            user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36'
-        )
-        page = await context.new_page()
-        return playwright, browser, page
-    
+            Browser: The shared browser instance
+        """
+        async with self._browser_lock:
+            if self._browser is None:
+                self._playwright = await async_playwright().start()
+                if config.CDP_URL:
+                    # Attach to an externally-managed Chromium so repeated
+                    # runs skip the cold start and reuse its disk cache
+                    self._browser = await self._playwright.chromium.connect_over_cdp(config.CDP_URL)
+                    logger.debug(f"Connected to shared browser at {config.CDP_URL}")
+                else:
+                    self._browser = await self._playwright.chromium.launch(
+                        headless=True, args=BROWSER_ARGS
+                    )
+                    logger.debug("Launched shared browser")
+            return self._browser
+
+    async def _close_browser(self):
+        """
+        Close the shared context and browser, and stop Playwright.
+        """
+        async with self._browser_lock:
+            if self._context is not None:
+                await self._context.close()
+                self._context = None
+            if self._browser is not None:
+                await self._browser.close()
+                self._browser = None
+            if self._playwright is not None:
+                await self._playwright.stop()
+                self._playwright = None
+
+    async def _get_http_session(self):
+        """
+        Get the shared aiohttp session, creating it on first use.
+
+        Returns:
+            aiohttp.ClientSession: Pooled HTTP session
+        """
+        async with self._http_lock:
+            if self._http_session is None:
+                self._http_session = aiohttp.ClientSession(
+                    connector=aiohttp.TCPConnector(limit=MAX_CONCURRENT_PAGES * 2, ttl_dns_cache=300),
+                    timeout=aiohttp.ClientTimeout(total=30),
+                    headers={'User-Agent': USER_AGENT}
+                )
+            return self._http_session
+
+    async def _close_http_session(self):
+        """
+        Close the shared aiohttp session.
+        """
+        async with self._http_lock:
+            if self._http_session is not None:
+                await self._http_session.close()
+                self._http_session = None
+
+    async def _fetch_via_http(self, full_url):
+        """
+        Fetch a page with plain HTTP, skipping the browser entirely.
+
+        The Breathe Bhutan pages are server-rendered WordPress, so the
+        content the extractors need is almost always present in the
+        initial HTML. Returns None when the fetch fails or the parsed
+        tree lacks the expected content blocks, in which case the
+        caller falls back to full browser rendering.
+
+        Args:
+            full_url (str): Absolute URL to fetch
+
+        Returns:
+            BeautifulSoup: Parsed HTML content, or None to fall back
+        """
+        cache_file = self._cache_path('GET', full_url)
+        body = None
+
+        if not self.refresh_cache and os.path.exists(cache_file):
+            try:
+                with gzip.open(cache_file, 'rt', encoding='utf-8') as f:
+                    entry = json.load(f)
+                body = base64.b64decode(entry['body'])
+                logger.debug(f"HTTP cache hit: {full_url}")
+            except Exception as e:
+                logger.error(f"Error reading HTTP cache entry: {str(e)}")
+
+        if body is None:
+            try:
+                session = await self._get_http_session()
+                async with session.get(full_url) as response:
+                    if response.status >= 400:
+                        logger.debug(f"HTTP fast path got {response.status} for: {full_url}")
+                        return None
+                    # Keep the raw bytes; decoding to str here would only
+                    # be undone again when the parser re-encodes for lxml
+                    body = await response.read()
+                    headers = {k: v for k, v in response.headers.items()
+                               if k.lower() not in VOLATILE_RESPONSE_HEADERS}
+                    status = response.status
+            except Exception as e:
+                logger.debug(f"HTTP fast path failed for {full_url}: {str(e)}")
+                return None
+
+            try:
+                entry = {
+                    'status': status,
+                    'headers': headers,
+                    'body': base64.b64encode(body).decode('ascii')
+                }
+                with gzip.open(cache_file, 'wt', encoding='utf-8') as f:
+                    json.dump(entry, f)
+            except Exception as e:
+                logger.error(f"Error writing HTTP cache entry: {str(e)}")
+
+        # bs4 detects the encoding and hands lxml the bytes directly
+        soup = BeautifulSoup(body, HTML_PARSER)
+
+        # If the expected content blocks are missing the page may need
+        # JavaScript; let the browser path take over
+        if soup.select_one(CONTENT_READY_SELECTOR) is None:
+            logger.debug(f"HTTP fast path missing content blocks for: {full_url}")
+            return None
+
+        return soup
+
+    @staticmethod
+    def _cache_path(method, url):
+        """
+        Compute the on-disk cache file for a request.
+
+        Args:
+            method (str): HTTP method
+            url (str): Request URL
+
+        Returns:
+            str: Path of the gzipped cache entry
+        """
+        key = hashlib.sha1(f"{method} {_normalize_cache_url(url)}".encode()).hexdigest()
+        return os.path.join(config.HTTP_CACHE_DIR, f"{key}.json.gz")
+
+    async def _replay_or_record(self, route):
+        """
+        Serve a request from the HTTP cache, fetching and recording on miss.
+
+        Args:
+            route (Route): Intercepted request route
+        """
+        request = route.request
+        cache_file = self._cache_path(request.method, request.url)
+
+        if not self.refresh_cache and os.path.exists(cache_file):
+            try:
+                with gzip.open(cache_file, 'rt', encoding='utf-8') as f:
+                    entry = json.load(f)
+                await route.fulfill(
+                    status=entry['status'],
+                    headers=entry['headers'],
+                    body=base64.b64decode(entry['body'])
+                )
+                logger.debug(f"HTTP cache hit: {request.url}")
+                return
+            except Exception as e:
+                logger.error(f"Error reading HTTP cache entry: {str(e)}")
+
+        response = await route.fetch()
+        body = await response.body()
+
+        # Only record successful responses so transient errors get retried
+        if response.status < 400:
+            try:
+                entry = {
+                    'status': response.status,
+                    'headers': response.headers,
+                    'body': base64.b64encode(body).decode('ascii')
+                }
+                with gzip.open(cache_file, 'wt', encoding='utf-8') as f:
+                    json.dump(entry, f)
+            except Exception as e:
+                logger.error(f"Error writing HTTP cache entry: {str(e)}")
+
+        await route.fulfill(response=response, body=body)
+
+    async def _handle_route(self, route):
+        """
+        Filter out unneeded resources, then replay or record the rest.
+
+        Args:
+            route (Route): Intercepted request route
+        """
+        request = route.request
+        if request.resource_type in BLOCKED_RESOURCE_TYPES or any(
+            host in request.url for host in BLOCKED_HOSTS
+        ):
+            await route.abort()
+        elif request.method == 'GET':
+            await self._replay_or_record(route)
+        else:
+            await route.continue_()
+
+    async def _get_context(self):
+        """
+        Get the shared BrowserContext, creating it on first use.
+
+        All scraped pages live on one host, so a single context lets
+        every page reuse the DNS cache, TLS session, and connection
+        pool warmed by the first navigation.
+
+        Returns:
+            BrowserContext: The shared context
+        """
+        browser = await self._get_browser()
+        async with self._browser_lock:
+            if self._context is None:
+                # A small viewport keeps style/layout computation cheap;
+                # the extractors only read text, never geometry
+                self._context = await browser.new_context(
+                    viewport={'width': 1280, 'height': 800},
+                    user_agent=USER_AGENT
+                )
+
+                # Only the HTML matters to the extractors; skip image/media
+                # bytes and tracker calls, and replay GETs from the disk cache
+                await self._context.route('**/*', self._handle_route)
+            return self._context
+
     async def _make_request(self, url):
         """
         Make a request to the given URL with error handling and retries.
-        
+
+        Requests run concurrently up to MAX_CONCURRENT_PAGES, each on its
+        own page inside the shared same-origin BrowserContext.
+
         Args:
             url (str): URL to request
-            
+
         Returns:
             BeautifulSoup: Parsed HTML content
         """
         full_url = urljoin(self.base_url, url)
         logger.debug(f"Making request to: {full_url}")
-        
+
+        # Try the plain-HTTP fast path first; these pages are
+        # server-rendered, so most never need a browser
+        soup = await self._fetch_via_http(full_url)
+        if soup is not None:
+            return soup
+
         max_retries = 3
         retry_delay = 2
-        
-        playwright, browser, page = await self._setup_browser()
-        
-        try:
-            for attempt in range(max_retries):
-                try:
-                    await page.goto(full_url, wait_until='networkidle')
-                    content = await page.content()
-                    
-                    logger.debug(f"Request successful: {full_url}")
-                    return BeautifulSoup(content, 'html.parser')
-                
-                except Exception as e:
-                    logger.error(f"Request error ({attempt+1}/{max_retries}): {str(e)}")
-                    
-                    if attempt < max_retries - 1:
-                        logger.debug(f"Retrying in {retry_delay} seconds...")
-                        await asyncio.sleep(retry_delay)
-                        retry_delay *= 2  # Exponential backoff
-                    else:
-                        logger.error(f"Failed to fetch {full_url} after {max_retries} attempts")
-                        raise
-        finally:
-            await browser.close()
-            await playwright.stop()
+
+        async with self._semaphore:
+            context = await self._get_context()
+            page = await context.new_page()
+
+            try:
+                for attempt in range(max_retries):
+                    try:
+                        # domcontentloaded fires as soon as the HTML is
+                        # parsed; networkidle would also wait out trackers
+                        # and ad beacons that the extractors never read
+                        await page.goto(full_url, wait_until='domcontentloaded', timeout=30000)
+
+                        try:
+                            await page.wait_for_selector(
+                                CONTENT_READY_SELECTOR, state='attached', timeout=10000
+                            )
+                        except PlaywrightTimeoutError:
+                            # Page has none of the expected content blocks;
+                            # parse whatever DOM is there
+                            logger.debug(f"No content selector found on: {full_url}")
+
+                        content = await page.content()
+
+                        logger.debug(f"Request successful: {full_url}")
+                        return BeautifulSoup(content, HTML_PARSER)
+
+                    except Exception as e:
+                        logger.error(f"Request error ({attempt+1}/{max_retries}): {str(e)}")
+
+                        if attempt < max_retries - 1:
+                            logger.debug(f"Retrying in {retry_delay} seconds...")
+                            await asyncio.sleep(retry_delay)
+                            retry_delay *= 2  # Exponential backoff
+                        else:
+                            logger.error(f"Failed to fetch {full_url} after {max_retries} attempts")
+                            raise
+            finally:
+                await page.close()
     
     async def scrape_homepage(self):
         """
@@ -148,7 +521,7 @@ class BhutanScraper:
             logger.error(f"Error scraping homepage: {str(e)}")
         
         # Save data to file
-        self._save_data(homepage_data, os.path.join(config.DATA_DIR, "homepage.json"))
+        await self._save_data_async(homepage_data, HOMEPAGE_FILE)
         logger.info("Homepage data saved")
         
         return homepage_data
@@ -175,8 +548,10 @@ class BhutanScraper:
             if not soup or soup.select('.review-item'):
                 soup = await self._make_request("/reviews/")
             
-            # Find all review/tour items on the page
-            review_items = soup.select('.review-item') or soup.select('.testimonial')
+            # Find all review/tour items in a single tree traversal,
+            # preferring .review-item matches when any exist
+            review_items = self._prefer_primary(
+                soup.select('.review-item, .testimonial'), 'review-item')
             
             for item in tqdm(review_items, desc="Processing cultural tours"):
                 try:
@@ -213,7 +588,7 @@ class BhutanScraper:
             logger.error(f"Error scraping cultural tours: {str(e)}")
         
         # Save data to file
-        self._save_data(tours, config.TOURS_FILE)
+        await self._save_data_async(tours, config.TOURS_FILE)
         logger.info(f"Scraped {len(tours)} cultural tours")
         
         return tours
@@ -233,8 +608,10 @@ class BhutanScraper:
             # Try to access festivals page
             soup = await self._make_request("/festivals/")
             
-            # Find all festival items on the page
-            festival_items = soup.select('.festival-item') or soup.select('.event-item')
+            # Find all festival items in a single tree traversal,
+            # preferring .festival-item matches when any exist
+            festival_items = self._prefer_primary(
+                soup.select('.festival-item, .event-item'), 'festival-item')
             
             if not festival_items:
                 # If no specific festival selectors are found, look for content blocks that might describe festivals
@@ -248,8 +625,7 @@ class BhutanScraper:
                         description_elem = block.select_one('p, .description, .content')
                         description = description_elem.text.strip() if description_elem else ""
                         
-                        if any(keyword in title.lower() or keyword in description.lower() 
-                               for keyword in ['festival', 'tshechu', 'celebration', 'traditional', 'ceremony']):
+                        if FESTIVAL_KEYWORDS_RE.search(title) or FESTIVAL_KEYWORDS_RE.search(description):
                             
                             festival_data = {
                                 'title': title,
@@ -293,7 +669,7 @@ class BhutanScraper:
             logger.error(f"Error scraping festivals: {str(e)}")
         
         # Save data to file
-        self._save_data(festivals, config.FESTIVALS_FILE)
+        await self._save_data_async(festivals, config.FESTIVALS_FILE)
         logger.info(f"Scraped {len(festivals)} festivals")
         
         return festivals
@@ -313,8 +689,10 @@ class BhutanScraper:
             # Try to access trekking page
             soup = await self._make_request("/trekking/")
             
-            # Find all trekking items on the page
-            trek_items = soup.select('.trek-item') or soup.select('.tour-item')
+            # Find all trekking items in a single tree traversal,
+            # preferring .trek-item matches when any exist
+            trek_items = self._prefer_primary(
+                soup.select('.trek-item, .tour-item'), 'trek-item')
             
             if not trek_items:
                 # Look for blog posts or reviews that might mention trekking
@@ -324,8 +702,7 @@ class BhutanScraper:
                     try:
                         text_content = block.text.strip()
                         
-                        if any(keyword in text_content.lower() 
-                               for keyword in ['trek', 'hiking', 'trail', 'mountain', 'hike', 'walk']):
+                        if TREK_KEYWORDS_RE.search(text_content):
                             
                             title_elem = block.select_one('h1, h2, h3, .title, strong')
                             title = title_elem.text.strip() if title_elem else "Bhutan Trekking Experience"
@@ -386,7 +763,7 @@ class BhutanScraper:
             logger.error(f"Error scraping trekking options: {str(e)}")
         
         # Save data to file
-        self._save_data(trekking_options, config.TREKKING_FILE)
+        await self._save_data_async(trekking_options, config.TREKKING_FILE)
         logger.info(f"Scraped {len(trekking_options)} trekking options")
         
         return trekking_options
@@ -403,18 +780,21 @@ class BhutanScraper:
         itineraries = []
         
         try:
-            # Try to access itineraries page
+            # Try to access itineraries page, falling back to alternates;
+            # cache the select result so each fetched tree is walked once
             soup = await self._make_request("/itineraries/")
-            
-            # Try alternate pages if the primary one doesn't work
-            if not soup or not soup.select('.itinerary-item'):
+            itinerary_items = soup.select('.itinerary-item') if soup else []
+
+            if not itinerary_items:
                 soup = await self._make_request("/tours/")
-            
-            if not soup or not soup.select('.itinerary-item'):
+                itinerary_items = soup.select('.itinerary-item') if soup else []
+
+            if not itinerary_items:
                 soup = await self._make_request("/about-us/")
-            
-            # Find all itinerary items on the page
-            itinerary_items = soup.select('.itinerary-item') or soup.select('.tour-item')
+                itinerary_items = soup.select('.itinerary-item') if soup else []
+
+            # Fall back to generic tour items on the final page
+            itinerary_items = itinerary_items or soup.select('.tour-item')
             
             if not itinerary_items:
                 # Look for content that might describe itineraries
@@ -424,8 +804,7 @@ class BhutanScraper:
                     try:
                         text_content = block.text.strip()
                         
-                        if any(keyword in text_content.lower() 
-                               for keyword in ['day', 'itinerary', 'schedule', 'plan', 'tour']):
+                        if ITINERARY_KEYWORDS_RE.search(text_content):
                             
                             title_elem = block.select_one('h1, h2, h3, .title')
                             title = title_elem.text.strip() if title_elem else "Bhutan Travel Itinerary"
@@ -439,7 +818,7 @@ class BhutanScraper:
                             
                             for day_elem in day_elems:
                                 day_text = day_elem.text.strip()
-                                if any(day_marker in day_text.lower() for day_marker in ['day', 'morning', 'afternoon', 'evening']):
+                                if DAY_MARKER_RE.search(day_text):
                                     # Find the description for this day
                                     day_description = ""
                                     next_elem = day_elem.find_next('p')
@@ -512,7 +891,7 @@ class BhutanScraper:
             logger.error(f"Error scraping itineraries: {str(e)}")
         
         # Save data to file
-        self._save_data(itineraries, config.ITINERARIES_FILE)
+        await self._save_data_async(itineraries, config.ITINERARIES_FILE)
         logger.info(f"Scraped {len(itineraries)} itineraries")
         
         return itineraries
@@ -570,11 +949,47 @@ class BhutanScraper:
             logger.error(f"Error scraping reviews: {str(e)}")
         
         # Save data to file
-        self._save_data(reviews, os.path.join(config.DATA_DIR, "reviews.json"))
+        await self._save_data_async(reviews, REVIEWS_FILE)
         logger.info(f"Scraped {len(reviews)} reviews")
         
         return reviews
     
+    @staticmethod
+    def _prefer_primary(items, primary_class):
+        """
+        Keep only the items carrying primary_class when any do.
+
+        Preserves the old select(a) or select(b) fallback semantics on
+        top of a single combined select: the secondary class only
+        contributes items when the primary one matched nothing.
+
+        Args:
+            items (list): Elements from a combined class selector
+            primary_class (str): Class name of the preferred selector
+
+        Returns:
+            list: Items with the primary class, or all items if none have it
+        """
+        primary = [item for item in items
+                   if primary_class in (item.get('class') or ())]
+        return primary if primary else items
+
+    @staticmethod
+    def _collect_text(elements):
+        """
+        Join the stripped text of a sequence of elements with newlines.
+
+        Shared by the section extractors, which all collect paragraph
+        and list-item text the same way.
+
+        Args:
+            elements (list): Parsed elements to read text from
+
+        Returns:
+            str: Newline-joined text content
+        """
+        return "\n".join(el.get_text(strip=True) for el in elements)
+
     def _extract_highlights_from_text(self, text):
         """
         Extract potential highlights from text content.
@@ -618,22 +1033,13 @@ class BhutanScraper:
         Returns:
             str: Extracted duration or None
         """
-        import re
-        
         # Look for patterns like "3 days", "10-day", "7-day tour", etc.
-        day_patterns = [
-            r'(\d+)[\s-]day',
-            r'(\d+)[\s-]days',
-            r'tour of (\d+) days',
-            r'for (\d+) days'
-        ]
-        
-        for pattern in day_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in DURATION_PATTERNS:
+            match = pattern.search(text)
             if match:
                 days = match.group(1)
                 return f"{days} days"
-        
+
         return None
     
     def _extract_difficulty_from_text(self, text):
@@ -669,22 +1075,11 @@ class BhutanScraper:
         Returns:
             list: List of daily itinerary items
         """
-        import re
-        
         itinerary_items = []
-        
+
         # Look for day patterns
-        day_patterns = [
-            r'Day (\d+)[:\-]([^\n]+)',
-            r'Day (\d+)\.([^\n]+)',
-            r'(\d+)st day[:\-]([^\n]+)',
-            r'(\d+)nd day[:\-]([^\n]+)',
-            r'(\d+)rd day[:\-]([^\n]+)',
-            r'(\d+)th day[:\-]([^\n]+)'
-        ]
-        
-        for pattern in day_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
+        for pattern in DAY_PATTERNS:
+            matches = pattern.findall(text)
             for match in matches:
                 day_num = match[0]
                 description = match[1].strip()
@@ -696,7 +1091,7 @@ class BhutanScraper:
         
         # If no clear day patterns found, try to split by common markers
         if not itinerary_items:
-            sections = re.split(r'\n\n|\r\n\r\n', text)
+            sections = SECTION_SPLIT_RE.split(text)
             for i, section in enumerate(sections[:7]):  # Limit to 7 days
                 if len(section.strip()) > 20:
                     itinerary_items.append({
@@ -715,11 +1110,46 @@ class BhutanScraper:
             file_path (str): Path to save the data to
         """
         try:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=4)
+            if orjson is not None:
+                with open(file_path, 'wb') as f:
+                    f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+            else:
+                with open(file_path, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, ensure_ascii=False, indent=4)
             logger.info(f"Data saved to {file_path}")
         except Exception as e:
             logger.error(f"Error saving data to {file_path}: {str(e)}")
+
+    async def _save_data_async(self, data, file_path):
+        """
+        Save scraped data without blocking the event loop.
+
+        Used by the scrape coroutines so a disk write never stalls the
+        pages still in flight alongside it.
+
+        Args:
+            data (list or dict): Data to save
+            file_path (str): Path to save the data to
+        """
+        await asyncio.to_thread(self._save_data, data, file_path)
+
+    async def _scrape_and_save(self, scrape_coro, file_path):
+        """
+        Run a scrape coroutine and persist its result immediately.
+
+        Writing as each section completes (instead of after the whole
+        batch) means a crash mid-run keeps everything finished so far.
+
+        Args:
+            scrape_coro (coroutine): Scrape coroutine to await
+            file_path (str): Path to save the result to
+
+        Returns:
+            list or dict: The scraped data
+        """
+        data = await scrape_coro
+        await self._save_data_async(data, file_path)
+        return data
     
     async def run_scraper(self):
         """
@@ -729,67 +1159,46 @@ class BhutanScraper:
         """
         try:
             logger.info("Starting scraper for Breathe Bhutan website")
-            
-            # Scrape homepage for basic site information
-            homepage_data = await self.scrape_homepage()
-            self._save_data(homepage_data, os.path.join(config.DATA_DIR, "homepage.json"))
-            logger.info("Homepage data saved successfully")
-            
-            # Scrape cultural tours information
-            cultural_tours = await self.scrape_cultural_tours()
-            self._save_data(cultural_tours, config.TOURS_FILE)
-            logger.info("Cultural tours data saved successfully")
-            
-            # Scrape festivals information
-            festivals = await self.scrape_festivals()
-            self._save_data(festivals, config.FESTIVALS_FILE)
-            logger.info("Festivals data saved successfully")
-            
-            # Scrape trekking information
-            trekking = await self.scrape_trekking()
-            self._save_data(trekking, config.TREKKING_FILE)
-            logger.info("Trekking data saved successfully")
-            
-            # Scrape itineraries information
-            itineraries = await self.scrape_itineraries()
-            self._save_data(itineraries, config.ITINERARIES_FILE)
-            logger.info("Itineraries data saved successfully")
-            
-            # Scrape testimonials/reviews
-            reviews = await self.scrape_reviews()
-            self._save_data(reviews, os.path.join(config.DATA_DIR, "testimonials.json"))
-            logger.info("Reviews data saved successfully")
-            
-            # Scrape contact and about information
-            about_data = await self.scrape_about_page()
-            self._save_data(about_data, os.path.join(config.DATA_DIR, "about.json"))
-            logger.info("About page data saved successfully")
-            
-            # Scrape FAQ and visa information
-            faq_data = await self.scrape_faq_page()
-            self._save_data(faq_data, os.path.join(config.DATA_DIR, "faq.json"))
-            logger.info("FAQ data saved successfully")
-            
-            # Scrape Bhutan travel guide
-            travel_guide = await self.scrape_travel_guide()
-            self._save_data(travel_guide, os.path.join(config.DATA_DIR, "travel_guide.json"))
-            logger.info("Travel guide data saved successfully")
-            
-            # Scrape Bhutan regions information
-            regions_data = await self.scrape_regions()
-            self._save_data(regions_data, os.path.join(config.DATA_DIR, "regions.json"))
-            logger.info("Regions data saved successfully")
-            
+
+            # The sections are independent of each other, so scrape them
+            # concurrently; _make_request caps in-flight pages via the
+            # shared semaphore. The first six coroutines persist their
+            # own category files as they finish; the rest are saved the
+            # moment they complete via _scrape_and_save, so a crash only
+            # loses sections still in flight
+            await asyncio.gather(
+                self.scrape_homepage(),
+                self.scrape_cultural_tours(),
+                self.scrape_festivals(),
+                self.scrape_trekking(),
+                self.scrape_itineraries(),
+                self._scrape_and_save(
+                    self.scrape_reviews(), TESTIMONIALS_FILE),
+                self._scrape_and_save(
+                    self.scrape_about_page(), ABOUT_FILE),
+                self._scrape_and_save(
+                    self.scrape_faq_page(), FAQ_FILE),
+                self._scrape_and_save(
+                    self.scrape_travel_guide(), TRAVEL_GUIDE_FILE),
+                self._scrape_and_save(
+                    self.scrape_regions(), REGIONS_FILE),
+            )
+
             # Create a comprehensive general info with everything combined
+            # (reads the files saved above, so it runs after the gather)
             general_info = self._create_comprehensive_general_info()
-            self._save_data(general_info, os.path.join(config.DATA_DIR, "general_info.json"))
+            self._save_data(general_info, GENERAL_INFO_FILE)
             logger.info("Comprehensive general info saved successfully")
-            
+
             logger.info("All data scraped and saved successfully")
-        
+
         except Exception as e:
             logger.error(f"Error during scraping process: {str(e)}")
             raise
+
+        finally:
+            await self._close_browser()
+            await self._close_http_session()
     
     async def scrape_about_page(self):
         """
@@ -802,14 +1211,12 @@ class BhutanScraper:
         
         try:
             about_url = urljoin(self.base_url, "/about-us/")
-            html = await self._make_request(about_url)
-            
-            if not html:
+            soup = await self._make_request(about_url)
+
+            if not soup:
                 logger.error("Failed to get About page")
                 return {}
             
-            soup = BeautifulSoup(html, 'html.parser')
-            
             # Initialize data structure
             about_data = {
                 "company_name": "Breathe Bhutan",
@@ -827,7 +1234,7 @@ class BhutanScraper:
                 if section_title:
                     section_data = {
                         "title": section_title.get_text(strip=True),
-                        "content": "\n".join([p.get_text(strip=True) for p in section_text])
+                        "content": self._collect_text(section_text)
                     }
                     about_data["about_sections"].append(section_data)
             
@@ -876,14 +1283,12 @@ class BhutanScraper:
         
         try:
             faq_url = urljoin(self.base_url, "/faq/")
-            html = await self._make_request(faq_url)
-            
-            if not html:
+            soup = await self._make_request(faq_url)
+
+            if not soup:
                 logger.error("Failed to get FAQ page")
                 return {}
             
-            soup = BeautifulSoup(html, 'html.parser')
-            
             # Initialize data structure
             faq_data = {
                 "general_faqs": [],
@@ -946,14 +1351,12 @@ class BhutanScraper:
         
         try:
             guide_url = urljoin(self.base_url, "/bhutan-travel-guide/")
-            html = await self._make_request(guide_url)
-            
-            if not html:
+            soup = await self._make_request(guide_url)
+
+            if not soup:
                 logger.error("Failed to get Travel Guide page")
                 return {}
             
-            soup = BeautifulSoup(html, 'html.parser')
-            
             # Initialize data structure
             guide_data = {
                 "travel_guide_sections": [],
@@ -973,7 +1376,7 @@ class BhutanScraper:
                 
                 if section_title:
                     title_text = section_title.get_text(strip=True)
-                    content = "\n".join([p.get_text(strip=True) for p in section_text])
+                    content = self._collect_text(section_text)
                     
                     section_data = {
                         "title": title_text,
@@ -1012,19 +1415,17 @@ class BhutanScraper:
         
         try:
             regions_url = urljoin(self.base_url, "/regions-of-bhutan/")
-            html = await self._make_request(regions_url)
-            
-            if not html:
+            soup = await self._make_request(regions_url)
+
+            if not soup:
                 # Try alternative URL structure
                 regions_url = urljoin(self.base_url, "/destinations/")
-                html = await self._make_request(regions_url)
-                
-                if not html:
+                soup = await self._make_request(regions_url)
+
+                if not soup:
                     logger.error("Failed to get Regions page")
                     return {}
             
-            soup = BeautifulSoup(html, 'html.parser')
-            
             # Initialize data structure
             regions_data = {
                 "regions": []
@@ -1041,7 +1442,7 @@ class BhutanScraper:
                 if region_name:
                     region_data = {
                         "name": region_name.get_text(strip=True),
-                        "description": "\n".join([p.get_text(strip=True) for p in region_desc]),
+                        "description": self._collect_text(region_desc),
                         "image_url": region_img['src'] if region_img and 'src' in region_img.attrs else "",
                         "attractions": []
                     }
@@ -1096,7 +1497,7 @@ class BhutanScraper:
             # Try to load existing data files to consolidate information
             try:
                 # Load travel guide data
-                travel_guide_path = os.path.join(config.DATA_DIR, "travel_guide.json")
+                travel_guide_path = TRAVEL_GUIDE_FILE
                 if os.path.exists(travel_guide_path):
                     with open(travel_guide_path, 'r', encoding='utf-8') as f:
                         travel_guide = json.load(f)
@@ -1128,7 +1529,7 @@ class BhutanScraper:
                             general_info["practical_information"][category] = item.get("content", "")
                 
                 # Load FAQ and visa data
-                faq_path = os.path.join(config.DATA_DIR, "faq.json")
+                faq_path = FAQ_FILE
                 if os.path.exists(faq_path):
                     with open(faq_path, 'r', encoding='utf-8') as f:
                         faq_data = json.load(f)
@@ -1157,7 +1558,7 @@ class BhutanScraper:
                                 general_info["visa_requirements"]["processing_time"] = answer
                 
                 # Load regions data
-                regions_path = os.path.join(config.DATA_DIR, "regions.json")
+                regions_path = REGIONS_FILE
                 if os.path.exists(regions_path):
                     with open(regions_path, 'r', encoding='utf-8') as f:
                         regions_data = json.load(f)
@@ -1176,7 +1577,7 @@ class BhutanScraper:
                         general_info["popular_destinations"].append(destination)
                 
                 # Load about data for contact information
-                about_path = os.path.join(config.DATA_DIR, "about.json")
+                about_path = ABOUT_FILE
                 if os.path.exists(about_path):
                     with open(about_path, 'r', encoding='utf-8') as f:
                         about_data = json.load(f)
@@ -29,7 +29,16 @@ class DataManager:
             'trekking': None,
             'itineraries': None
         }
-        
+
+        # Memoized filter_by_duration results, keyed by
+        # (data_type, min_days, max_days); invalidated on writes
+        self._duration_cache = {}
+
+        # Parsed duration column per data type: a list of day counts
+        # (None where unparseable) parallel to the loaded items, so each
+        # new duration range only compares integers
+        self._duration_days = {}
+
         logger.info("DataManager initialized")
     
     def load_data(self, data_type: str) -> List[Dict[str, Any]]:
@@ -96,10 +105,15 @@ class DataManager:
                 json.dump(data, f, ensure_ascii=False, indent=4)
             
             logger.info(f"Saved {len(data)} {data_type} to {file_path}")
-            
-            # Update cache
+
+            # Update cache and drop stale filter results for this type
             self._cache[data_type] = data
-            
+            self._duration_days.pop(data_type, None)
+            self._duration_cache = {
+                key: value for key, value in self._duration_cache.items()
+                if key[0] != data_type
+            }
+
             return True
         
         except Exception as e:
@@ -176,26 +190,39 @@ class DataManager:
         Returns:
             list: List of filtered items
         """
+        # Repeated preference queries hit the same (type, range) keys;
+        # serve those from memory instead of rescanning every item
+        cache_key = (data_type, min_days, max_days)
+        if cache_key in self._duration_cache:
+            logger.debug(f"Returning cached duration filter for {cache_key}")
+            return self._duration_cache[cache_key]
+
         data = self.load_data(data_type)
-        results = []
-        
-        for item in data:
-            # Extract duration as number of days
-            duration_str = item.get('duration', '')
-            try:
+
+        # Build the parsed duration column once per data type; later
+        # range queries then scan plain integers
+        days_column = self._duration_days.get(data_type)
+        if days_column is None or len(days_column) != len(data):
+            days_column = []
+            for item in data:
                 # Attempt to extract number of days from duration string (e.g., "7 days")
-                days = int(''.join(filter(str.isdigit, duration_str)))
-                
-                # Apply filter
-                if days >= min_days and (max_days is None or days <= max_days):
-                    results.append(item)
-            
-            except (ValueError, TypeError):
-                # If we can't extract days, skip this item
-                logger.warning(f"Could not parse duration from: {duration_str}")
-                continue
-        
+                duration_str = item.get('duration', '')
+                try:
+                    days_column.append(int(''.join(filter(str.isdigit, duration_str))))
+                except (ValueError, TypeError):
+                    # If we can't extract days, mark this item as unparseable
+                    logger.warning(f"Could not parse duration from: {duration_str}")
+                    days_column.append(None)
+            self._duration_days[data_type] = days_column
+
+        results = [
+            item for item, days in zip(data, days_column)
+            if days is not None and days >= min_days and (max_days is None or days <= max_days)
+        ]
+
         logger.info(f"Found {len(results)} {data_type} with duration between {min_days} and {max_days or 'any'} days")
+
+        self._duration_cache[cache_key] = results
         return results
     
     def update_item(self, data_type: str, item_id: str, updates: Dict[str, Any]) -> bool:
@@ -238,6 +265,8 @@ class DataManager:
             'trekking': None,
             'itineraries': None
         }
+        self._duration_cache = {}
+        self._duration_days = {}
         logger.info("Data cache cleared")
     
     def _get_file_path(self, data_type: str) -> Optional[str]:
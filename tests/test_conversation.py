@@ -105,17 +105,17 @@ class TestConversationManager(unittest.TestCase):
         """
         Test the affirmative response checker.
         """
-        self.assertTrue(self.conversation_manager._is_affirmative("Yes, I like that plan"))
-        self.assertTrue(self.conversation_manager._is_affirmative("Sure, sounds good"))
-        self.assertFalse(self.conversation_manager._is_affirmative("No, I don't like it"))
+        self.assertTrue(self.conversation_manager._is_affirmative("yes, i like that plan"))
+        self.assertTrue(self.conversation_manager._is_affirmative("sure, sounds good"))
+        self.assertFalse(self.conversation_manager._is_affirmative("no, i don't like it"))
     
     def test_is_negative(self):
         """
         Test the negative response checker.
         """
-        self.assertTrue(self.conversation_manager._is_negative("No, I don't like that"))
-        self.assertTrue(self.conversation_manager._is_negative("I want something different"))
-        self.assertFalse(self.conversation_manager._is_negative("Yes, that's perfect"))
+        self.assertTrue(self.conversation_manager._is_negative("no, i don't like that"))
+        self.assertTrue(self.conversation_manager._is_negative("i want something different"))
+        self.assertFalse(self.conversation_manager._is_negative("yes, that's perfect"))
     
     def test_end_conversation(self):
         """
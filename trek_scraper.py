@@ -101,11 +101,15 @@ def extract_trek_urls_from_sitemap():
         # Extract all URLs from sitemap
         urls = re.findall(r'<loc>(https://www\.breathebhutan\.com/.*?)</loc>', sitemap_content)
         
-        # Filter to include only trek-related URLs
+        # Filter to include only trek-related URLs, dropping the duplicate
+        # <loc> entries sitemaps often carry while preserving order
+        seen = set()
         trek_urls = []
         for url in urls:
             if 'trekking-in-bhutan/' in url and not url.endswith('trekking-in-bhutan/') and 'category' not in url:
-                trek_urls.append(url)
+                if url not in seen:
+                    seen.add(url)
+                    trek_urls.append(url)
                 
         logger.info(f"Found {len(trek_urls)} trek URLs from sitemap")
         
@@ -128,13 +132,17 @@ def extract_trek_urls_from_main_page():
         trek_urls = []
         
         if soup:
-            # Find all "Explore" buttons for treks
+            # Find all "Explore" buttons for treks; a set keeps repeated
+            # links (e.g. image + button pointing at the same trek) out
+            seen = set()
             trek_links = soup.select('a.btn.btn-travel')
             for link in trek_links:
                 if "Explore" in link.text and link.get('href'):
                     trek_url = link.get('href')
-                    trek_urls.append(trek_url)
-                    logger.info(f"Found trek URL from main page: {trek_url}")
+                    if trek_url not in seen:
+                        seen.add(trek_url)
+                        trek_urls.append(trek_url)
+                        logger.info(f"Found trek URL from main page: {trek_url}")
         
         return trek_urls
     except Exception as e: